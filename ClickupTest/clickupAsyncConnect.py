@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import aiohttp
+from ClickupTest.clickupConnect import HEADERS, POOL_MAXSIZE, KEEP_ALIVE, MAX_RETRIES, rate_limiter, retry_delay
+
+# Total connections the async pool may open (per host it is capped at CLICKUP_POOL_MAXSIZE)
+ASYNC_POOL_LIMIT = POOL_MAXSIZE * 4
+KEEPALIVE_TIMEOUT = 30
+
+_loop = None
+_loop_lock = threading.Lock()
+_async_session = None
+
+
+def get_loop():
+    """Return the single event loop used for ClickUp calls, started in a background thread on first use."""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="clickup-async", daemon=True).start()
+                _loop = loop
+    return _loop
+
+
+def run_sync(coro):
+    """Run a coroutine on the shared ClickUp loop and block until it finishes."""
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result()
+
+
+async def get_async_session():
+    """Return the shared aiohttp session. Must be awaited on the shared loop."""
+    global _async_session
+    if _async_session is None or _async_session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=ASYNC_POOL_LIMIT,
+            limit_per_host=POOL_MAXSIZE,
+            keepalive_timeout=KEEPALIVE_TIMEOUT if KEEP_ALIVE else None,
+            force_close=not KEEP_ALIVE,
+        )
+        _async_session = aiohttp.ClientSession(connector=connector, headers=HEADERS)
+    return _async_session
+
+
+async def async_make_request(url, method="get", data=None, quiet=False):
+    """
+    Async counterpart of make_request for GET, POST, and PUT methods with JSON bodies.
+    :param quiet: Return None on errors without printing them (background requests).
+    """
+    try:
+        if method.lower() not in ("get", "post", "put"):
+            raise ValueError("Invalid HTTP method provided.")
+
+        session = await get_async_session()
+        for attempt in range(MAX_RETRIES + 1):
+            wait = rate_limiter.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            kwargs = {} if method.lower() == "get" else {"json": data}
+            async with session.request(method.upper(), url, **kwargs) as response:
+                rate_limiter.update(response.headers)
+
+                if response.status == 429 and attempt < MAX_RETRIES:
+                    delay = retry_delay(response.headers)
+                    if not quiet:
+                        print(f"ClickUp rate limit reached, retrying in {delay:.0f}s...")
+                    rate_limiter.backoff(delay)
+                    continue
+
+                body = await response.read()
+                if response.status >= 400:
+                    if quiet:
+                        return None
+                    print(f"HTTP error occurred: {response.status} {response.reason}")
+                    if body:
+                        try:
+                            print("Error details:", await response.json(content_type=None))
+                        except ValueError:
+                            print("Error reading error details, raw content:", body.decode(errors="replace"))
+                    return None
+                return await response.json(content_type=None) if body else None
+
+    except asyncio.TimeoutError:
+        if not quiet:
+            print(f"An error occurred: the request to {url} timed out")
+        return None
+    except aiohttp.ClientError as e:
+        if not quiet:
+            print(f"An error occurred: {e}")
+        return None
+    except ValueError as e:
+        if not quiet:
+            print(f"A ValueError occurred: {e}")
+        return None
@@ -1,6 +1,7 @@
 import os
+import threading
+import time
 from dotenv import load_dotenv
-import requests
 
 # Load environment variables
 load_dotenv()  # Make sure to load the .env file, assumes .env is in the root or environment path is set
@@ -15,29 +16,183 @@ HEADERS = {
     "Authorization": CLICKUP_TOKEN,
 }
 
+# Connection pool settings (shared by every ClickUp call in the process)
+POOL_CONNECTIONS = int(os.getenv("CLICKUP_POOL_CONNECTIONS", "4"))  # Number of hosts to keep pools for
+POOL_MAXSIZE = int(os.getenv("CLICKUP_POOL_MAXSIZE", "10"))  # Max open connections per host
+POOL_BLOCK = os.getenv("CLICKUP_POOL_BLOCK", "true").lower() == "true"  # Wait for a free connection instead of opening extras
+KEEP_ALIVE = os.getenv("CLICKUP_KEEP_ALIVE", "true").lower() == "true"
 
-def make_request(url, method="get", data=None, files=None):
-    """Handles making HTTP requests and error management for GET, POST, and PUT methods."""
+# Request budget (ClickUp allows 100 requests per minute per token on most plans)
+RATE_LIMIT_PER_MINUTE = int(os.getenv("CLICKUP_RATE_LIMIT", "100"))
+MAX_RETRIES = int(os.getenv("CLICKUP_MAX_RETRIES", "3"))
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class RateLimiter:
+    """
+    Token bucket that paces outgoing ClickUp calls.
+    The bucket refills at the per-minute budget and is kept in sync with the
+    X-RateLimit-* headers ClickUp sends back on every response.
+    """
+
+    def __init__(self, per_minute):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self):
+        """Takes one token and returns how many seconds the caller must wait before sending."""
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.blocked_until - now)
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def update(self, headers):
+        """Adopts the server's view of the remaining budget from the response headers."""
+        try:
+            limit = headers.get("X-RateLimit-Limit")
+            remaining = headers.get("X-RateLimit-Remaining")
+            reset = headers.get("X-RateLimit-Reset")
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if limit:
+                    self.capacity = float(limit)
+                    self.rate = self.capacity / 60.0
+                if remaining is not None:
+                    self.tokens = min(self.tokens, float(remaining))
+                    if float(remaining) <= 0 and reset:
+                        self.blocked_until = max(self.blocked_until, now + seconds_until_reset(reset))
+        except (TypeError, ValueError):
+            pass  # Malformed headers, keep pacing on our own estimate
+
+    def backoff(self, seconds):
+        """Blocks every caller for `seconds` after the server rejected a request."""
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens = min(self.tokens, 0.0)
+            self.blocked_until = max(self.blocked_until, now + seconds)
+
+
+rate_limiter = RateLimiter(RATE_LIMIT_PER_MINUTE)
+
+
+def seconds_until_reset(reset):
+    """Converts an X-RateLimit-Reset value (unix seconds) into a delay from now."""
+    return max(float(reset) - time.time(), 0.0)
+
+
+def retry_delay(headers):
+    """How long to wait before retrying a 429, based on the headers ClickUp sent."""
     try:
-        methods = {"get": requests.get, "post": requests.post, "put": requests.put}
+        if headers.get("X-RateLimit-Reset"):
+            return seconds_until_reset(headers["X-RateLimit-Reset"]) + 1
+        if headers.get("Retry-After"):
+            return float(headers["Retry-After"])
+    except (TypeError, ValueError):
+        pass
+    return 60.0 / max(RATE_LIMIT_PER_MINUTE, 1)
+
+
+def get_session():
+    """Return the process-wide ClickUp session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests  # Loaded with the first ClickUp call, not at import time
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, pool_block=POOL_BLOCK)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers["Connection"] = "keep-alive" if KEEP_ALIVE else "close"
+                _session = session
+    return _session
+
+
+def connection_stats():
+    """
+    Returns connection counters for the shared session.
+    :return: Dict with the number of requests sent, connections opened and connections reused.
+    """
+    opened = 0
+    sent = 0
+    if _session is not None:
+        for adapter in set(_session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                opened += pool.num_connections
+                sent += pool.num_requests
+    return {"requests": sent, "opened": opened, "reused": max(sent - opened, 0)}
+
+
+def make_request(url, method="get", data=None, files=None, quiet=False):
+    """
+    Handles making HTTP requests and error management for GET, POST, and PUT methods.
+    :param quiet: Return None on errors without printing them (background requests).
+    """
+    import requests
+
+    try:
+        session = get_session()
+        methods = {"get": session.get, "post": session.post, "put": session.put}
         method_func = methods.get(method.lower())
 
         if method_func is None:
             raise ValueError("Invalid HTTP method provided.")
 
-        if method == "get":
-            response = method_func(url, headers=HEADERS)
-        elif files:
-            # Modify headers for multipart/form-data, let requests handle 'Content-Type'
-            multipart_headers = {key: value for key, value in HEADERS.items() if key.lower() != "content-type"}
-            response = method_func(url, headers=multipart_headers, files=files, data=data)
-        else:
-            response = method_func(url, headers=HEADERS, json=data)
+        for attempt in range(MAX_RETRIES + 1):
+            rate_limiter.acquire()
+            if method == "get":
+                response = method_func(url, headers=HEADERS)
+            elif files:
+                # Modify headers for multipart/form-data, let requests handle 'Content-Type'
+                multipart_headers = {key: value for key, value in HEADERS.items() if key.lower() != "content-type"}
+                response = method_func(url, headers=multipart_headers, files=files, data=data)
+            else:
+                response = method_func(url, headers=HEADERS, json=data)
+            rate_limiter.update(response.headers)
+
+            if response.status_code != 429 or attempt == MAX_RETRIES:
+                break
+
+            # Rate limited: wait for the advertised reset, then send the same request again
+            delay = retry_delay(response.headers)
+            if not quiet:
+                print(f"ClickUp rate limit reached, retrying in {delay:.0f}s...")
+            rate_limiter.backoff(delay)
+            for _, file_info in (files or {}).items():
+                if hasattr(file_info[1], "seek"):
+                    file_info[1].seek(0)
 
         response.raise_for_status()
         return response.json() if response.content else None
 
     except requests.HTTPError as e:
+        if quiet:
+            return None
         print(f"HTTP error occurred: {e.response.status_code} {e.response.reason}")
         if e.response.content:
             try:
@@ -46,10 +201,12 @@ def make_request(url, method="get", data=None, files=None):
                 print("Error reading error details, raw content:", e.response.text)
         return None
     except requests.RequestException as e:
-        print(f"An error occurred: {e}")
+        if not quiet:
+            print(f"An error occurred: {e}")
         return None
     except ValueError as e:
-        print(f"A ValueError occurred: {e}")
+        if not quiet:
+            print(f"A ValueError occurred: {e}")
         return None
 
 
@@ -68,6 +225,9 @@ def test_clickup_connection():
     else:
         print("Failed to establish a connection. Check your API token and network settings.")
 
+    stats = connection_stats()
+    print(f"Connections opened: {stats['opened']}, reused: {stats['reused']} ({stats['requests']} requests)")
+
 
 def main():
     test_clickup_connection()
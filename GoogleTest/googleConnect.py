@@ -1,8 +1,10 @@
 import os
+import threading
+import time
 from dotenv import load_dotenv
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+
+# The Google client libraries are imported inside the functions that need them,
+# so importing this module (e.g. for SHEET_NAME) stays cheap until Sheets is actually used.
 
 load_dotenv()
 
@@ -16,11 +18,198 @@ TEMPLATE_SHEET_NAME = os.getenv("GOOGLE_SHEET_TEMPLATE")  # This is the name of
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 
 
+_credentials = None
+_service = None
+_service_lock = threading.Lock()
+_thread_http = threading.local()
+
+# Seconds the first google_connect() call spent loading credentials and building the service
+service_build_seconds = None
+
+
+def get_credentials():
+    """Load the service account credentials once per process."""
+    global _credentials
+    if _credentials is None:
+        from google.oauth2.service_account import Credentials
+
+        _credentials = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
+    return _credentials
+
+
+def authorized_http():
+    """Return this thread's authorized HTTP client (httplib2 connections must not be shared across threads)."""
+    if getattr(_thread_http, "http", None) is None:
+        import httplib2
+        import google_auth_httplib2
+
+        _thread_http.http = google_auth_httplib2.AuthorizedHttp(get_credentials(), http=httplib2.Http())
+    return _thread_http.http
+
+
+def build_request(http, *args, **kwargs):
+    """Request builder that sends each call through the calling thread's HTTP client."""
+    from googleapiclient.http import HttpRequest
+
+    return HttpRequest(authorized_http(), *args, **kwargs)
+
+
 def google_connect():
-    """Create and return a Google Sheets API service object."""
-    credentials = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
-    service = build("sheets", "v4", credentials=credentials)
-    return service
+    """Return the process-wide Google Sheets API service object, building it on first use."""
+    global _service, service_build_seconds
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                started = time.perf_counter()
+                from googleapiclient.discovery import build
+
+                # static_discovery uses the discovery document bundled with google-api-python-client,
+                # so nothing is downloaded or re-parsed from the network
+                _service = build(
+                    "sheets",
+                    "v4",
+                    http=authorized_http(),
+                    requestBuilder=build_request,
+                    static_discovery=True,
+                    cache_discovery=False,
+                )
+                service_build_seconds = time.perf_counter() - started
+                print(f"Google Sheets service ready in {service_build_seconds:.2f}s")
+    return _service
+
+
+_sheet_properties = {}
+_sheet_properties_lock = threading.Lock()
+
+
+def get_sheet_properties(spreadsheet_id, refresh=False):
+    """
+    Return {tab title: sheet properties} for a spreadsheet.
+    Only `sheets.properties` is requested, once per spreadsheet; later calls are served from memory
+    until invalidate_sheet_properties() is called (e.g. after a tab is duplicated or deleted).
+    Tabs created outside this process are not in the cached copy, look single tabs up with find_sheet_properties().
+    """
+    with _sheet_properties_lock:
+        if refresh or spreadsheet_id not in _sheet_properties:
+            metadata = google_connect().spreadsheets().get(spreadsheetId=spreadsheet_id, fields="sheets.properties").execute()
+            _sheet_properties[spreadsheet_id] = {sheet["properties"]["title"]: sheet["properties"] for sheet in metadata.get("sheets", [])}
+        return _sheet_properties[spreadsheet_id]
+
+
+def find_sheet_properties(spreadsheet_id, title):
+    """
+    Return the properties of one tab, or None if the spreadsheet has no tab with that title.
+    A miss re-reads the metadata once, since the tab may have been added by someone else since it was cached.
+    """
+    properties = get_sheet_properties(spreadsheet_id).get(title)
+    if properties is None:
+        properties = get_sheet_properties(spreadsheet_id, refresh=True).get(title)
+    return properties
+
+
+def invalidate_sheet_properties(spreadsheet_id):
+    """Forget the cached tab metadata of a spreadsheet."""
+    with _sheet_properties_lock:
+        _sheet_properties.pop(spreadsheet_id, None)
+
+
+def grid_expansion_requests(sheet_id, grid_properties, rows, columns):
+    """appendDimension requests growing a grid of `grid_properties` (rowCount/columnCount) to at least rows x columns."""
+    requests = []
+    dimensions = (("ROWS", rows, grid_properties.get("rowCount", 0)), ("COLUMNS", columns, grid_properties.get("columnCount", 0)))
+    for dimension, needed, current in dimensions:
+        if needed > current:
+            requests.append({"appendDimension": {"sheetId": sheet_id, "dimension": dimension, "length": needed - current}})
+    return requests
+
+
+def ensure_grid_size(spreadsheet_id, title, rows, columns):
+    """
+    Grows a tab so that writing rows x columns values from A1 fits inside its grid.
+    Uses the cached gridProperties, so a tab that is already large enough costs no request.
+    """
+    properties = find_sheet_properties(spreadsheet_id, title)
+    if properties is None:
+        return
+    requests = grid_expansion_requests(properties["sheetId"], properties.get("gridProperties", {}), rows, columns)
+    if requests:
+        google_connect().spreadsheets().batchUpdate(spreadsheetId=spreadsheet_id, body={"requests": requests}).execute()
+        invalidate_sheet_properties(spreadsheet_id)
+
+
+def get_conditional_formats(spreadsheet_id, sheet_id):
+    """Return the conditional format rules of one tab, in priority order."""
+    metadata = (
+        google_connect()
+        .spreadsheets()
+        .get(spreadsheetId=spreadsheet_id, fields="sheets(properties.sheetId,conditionalFormats)")
+        .execute()
+    )
+    for sheet in metadata.get("sheets", []):
+        # The API leaves out ids and indices that are 0
+        if sheet.get("properties", {}).get("sheetId", 0) == sheet_id:
+            return sheet.get("conditionalFormats", [])
+    return []
+
+
+def normalize_grid_range(grid_range):
+    keys = ("sheetId", "startRowIndex", "endRowIndex", "startColumnIndex", "endColumnIndex")
+    return tuple(grid_range.get(key, 0 if key != "endRowIndex" else None) for key in keys)
+
+
+def normalize_color(color):
+    return tuple(round(color.get(channel, 0), 3) for channel in ("red", "green", "blue"))
+
+
+def text_rule_requests(spreadsheet_id, sheet_id, grid_range, colors):
+    """
+    Requests that make the TEXT_EQ background rules on `grid_range` match `colors` exactly.
+    Rules already in place are left alone, so running this again sends nothing. Stale or duplicated
+    rules on the range are rewritten or removed; rules on other ranges are never touched.
+    Updates come first, then deletes from the highest index down, then adds, so no request
+    shifts the index another one refers to.
+
+    :param grid_range: GridRange the rules apply to (e.g. the status column below the header).
+    :param colors: {cell text: {"red", "green", "blue"}} background colour per value.
+    """
+    target_column = (grid_range.get("startColumnIndex", 0), grid_range.get("endColumnIndex"))
+
+    def desired_rule(text, color):
+        return {
+            "ranges": [grid_range],
+            "booleanRule": {
+                "condition": {"type": "TEXT_EQ", "values": [{"userEnteredValue": text}]},
+                "format": {"backgroundColor": color},
+            },
+        }
+
+    updates, deletes = [], []
+    found = set()
+    for index, rule in enumerate(get_conditional_formats(spreadsheet_id, sheet_id)):
+        condition = rule.get("booleanRule", {}).get("condition", {})
+        ranges = rule.get("ranges", [])
+        if condition.get("type") != "TEXT_EQ" or not ranges:
+            continue
+        if any((r.get("startColumnIndex", 0), r.get("endColumnIndex")) != target_column for r in ranges):
+            continue
+
+        text = (condition.get("values") or [{}])[0].get("userEnteredValue")
+        if text not in colors or text in found:
+            deletes.append(index)
+            continue
+        found.add(text)
+        color = rule["booleanRule"].get("format", {}).get("backgroundColor", {})
+        if [normalize_grid_range(r) for r in ranges] != [normalize_grid_range(grid_range)] or normalize_color(color) != normalize_color(
+            colors[text]
+        ):
+            updates.append({"updateConditionalFormatRule": {"index": index, "sheetId": sheet_id, "rule": desired_rule(text, colors[text])}})
+
+    requests = updates
+    requests += [{"deleteConditionalFormatRule": {"index": index, "sheetId": sheet_id}} for index in reversed(deletes)]
+    requests += [
+        {"addConditionalFormatRule": {"rule": desired_rule(text, color), "index": 0}} for text, color in colors.items() if text not in found
+    ]
+    return requests
 
 
 def make_nls_request(range_notation: str) -> dict:
@@ -28,6 +217,8 @@ def make_nls_request(range_notation: str) -> dict:
     Fetch the given range from the sheet and return the raw JSON response.
     Example range_notation: "'Sheet1'!A1:I"
     """
+    from googleapiclient.errors import HttpError
+
     service = google_connect()
     sheet = service.spreadsheets()
     try:
@@ -38,9 +229,10 @@ def make_nls_request(range_notation: str) -> dict:
 
 
 def test_google_sheet_connection():
+    from googleapiclient.errors import HttpError
+
     try:
-        credentials = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
-        service = build("sheets", "v4", credentials=credentials)
+        service = google_connect()
         sheet = service.spreadsheets()
 
         read_range = f"'{SHEET_NAME}'!A1"
@@ -0,0 +1,214 @@
+import os
+import json
+import sqlite3
+import threading
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Constants
+CACHE_PATH = os.getenv("CACHE_PATH", ".cache/nls-maintenance.sqlite3")
+
+# Seconds before a cached entry is considered stale, per kind of entity
+CACHE_TTL = {
+    "folders": int(os.getenv("CACHE_TTL_FOLDERS", "86400")),
+    "lists": int(os.getenv("CACHE_TTL_LISTS", "86400")),
+    "sites": int(os.getenv("CACHE_TTL_SITES", "900")),
+    "whois": int(os.getenv("CACHE_TTL_WHOIS", "604800")),  # Domain expiry dates change about once a year
+    "whois_miss": int(os.getenv("CACHE_TTL_WHOIS_MISS", "3600")),  # Failed lookups are retried sooner
+    "versions": int(os.getenv("CACHE_TTL_VERSIONS", "3600")),  # Latest WordPress core/plugin versions
+    "versions_miss": int(os.getenv("CACHE_TTL_VERSIONS_MISS", "300")),
+}
+
+_connection = None
+_lock = threading.RLock()
+
+
+def get_connection():
+    """Return the shared SQLite connection, creating the database on first use."""
+    global _connection
+    with _lock:
+        if _connection is None:
+            directory = os.path.dirname(CACHE_PATH)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries (kind TEXT NOT NULL, key TEXT NOT NULL, payload TEXT NOT NULL, "
+                "fetched_at REAL NOT NULL, PRIMARY KEY (kind, key))"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS tasks (scope TEXT NOT NULL, id TEXT NOT NULL, list_id TEXT, name TEXT, status TEXT, "
+                "member INTEGER NOT NULL, date_updated INTEGER, PRIMARY KEY (scope, id))"
+            )
+            connection.execute("CREATE TABLE IF NOT EXISTS watermarks (scope TEXT PRIMARY KEY, value INTEGER NOT NULL, synced_at REAL NOT NULL)")
+            connection.execute("CREATE TABLE IF NOT EXISTS synced_lists (scope TEXT NOT NULL, list_id TEXT NOT NULL, PRIMARY KEY (scope, list_id))")
+            connection.commit()
+            _connection = connection
+    return _connection
+
+
+def cache_get(kind, key, ttl=None):
+    """
+    Returns the cached value for (kind, key), or None if it is missing or older than its TTL.
+    :param ttl: Seconds the entry stays fresh, defaults to CACHE_TTL[kind].
+    """
+    ttl = CACHE_TTL.get(kind, 0) if ttl is None else ttl
+    with _lock:
+        row = get_connection().execute("SELECT payload, fetched_at FROM entries WHERE kind = ? AND key = ?", (kind, key)).fetchone()
+    if row is None or time.time() - row[1] > ttl:
+        return None
+    return json.loads(row[0])
+
+
+def cache_get_entry(kind, key):
+    """Returns (value, fetched_at) for (kind, key) however old it is, or (None, None) if it was never cached."""
+    with _lock:
+        row = get_connection().execute("SELECT payload, fetched_at FROM entries WHERE kind = ? AND key = ?", (kind, key)).fetchone()
+    return (json.loads(row[0]), row[1]) if row else (None, None)
+
+
+def cache_put(kind, key, value):
+    with _lock:
+        connection = get_connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO entries (kind, key, payload, fetched_at) VALUES (?, ?, ?, ?)",
+            (kind, key, json.dumps(value), time.time()),
+        )
+        connection.commit()
+
+
+def cache_invalidate(kind=None, key=None):
+    """Drops one entry, every entry of a kind, or the whole cache when called without arguments."""
+    with _lock:
+        connection = get_connection()
+        if kind is None:
+            connection.execute("DELETE FROM entries")
+        elif key is None:
+            connection.execute("DELETE FROM entries WHERE kind = ?", (kind,))
+        else:
+            connection.execute("DELETE FROM entries WHERE kind = ? AND key = ?", (kind, key))
+        connection.commit()
+
+
+def cached(kind, key, fetch, refresh=False):
+    """
+    Serves (kind, key) from the cache while it is fresh, otherwise calls `fetch()` and stores the result.
+    Failed fetches (None) are not cached.
+    :param refresh: Skip the cache and always call `fetch()`.
+    """
+    if not refresh:
+        value = cache_get(kind, key)
+        if value is not None:
+            return value
+    value = fetch()
+    if value is not None:
+        cache_put(kind, key, value)
+    return value
+
+
+#
+#
+#
+# Task store (incremental sync)
+#
+#
+#
+
+
+def get_watermark(scope):
+    """
+    Returns (date_updated watermark in ms, time of the full sync it grew from) for a sync scope,
+    or (None, None) if the scope was never synced.
+    """
+    with _lock:
+        row = get_connection().execute("SELECT value, synced_at FROM watermarks WHERE scope = ?", (scope,)).fetchone()
+    return (row[0], row[1]) if row else (None, None)
+
+
+def set_watermark(scope, value, synced_at=None):
+    with _lock:
+        connection = get_connection()
+        if synced_at is None:
+            connection.execute("UPDATE watermarks SET value = ? WHERE scope = ?", (value, scope))
+        else:
+            connection.execute("INSERT OR REPLACE INTO watermarks (scope, value, synced_at) VALUES (?, ?, ?)", (scope, value, synced_at))
+        connection.commit()
+
+
+def reset_task_store(scope):
+    """Forgets every stored task and the watermark of a scope, forcing a full sync."""
+    with _lock:
+        connection = get_connection()
+        connection.execute("DELETE FROM tasks WHERE scope = ?", (scope,))
+        connection.execute("DELETE FROM watermarks WHERE scope = ?", (scope,))
+        connection.execute("DELETE FROM synced_lists WHERE scope = ?", (scope,))
+        connection.commit()
+
+
+def get_synced_lists(scope):
+    """Returns the ids of the lists that have had a full sync in a scope."""
+    with _lock:
+        rows = get_connection().execute("SELECT list_id FROM synced_lists WHERE scope = ?", (scope,)).fetchall()
+    return {row[0] for row in rows}
+
+
+def add_synced_lists(scope, list_ids):
+    with _lock:
+        connection = get_connection()
+        connection.executemany("INSERT OR IGNORE INTO synced_lists (scope, list_id) VALUES (?, ?)", [(scope, str(id)) for id in list_ids])
+        connection.commit()
+
+
+def set_sheet_synced(title, synced=True):
+    """
+    Records whether a month tab is known to hold exactly the data it was last given.
+    Only set after a successful write; anything that may have left the tab behind clears it.
+    """
+    if synced:
+        cache_put("sheet_synced", title, True)
+    else:
+        cache_invalidate("sheet_synced", title)
+
+
+def is_sheet_synced(title):
+    return cache_get_entry("sheet_synced", title)[0] is True
+
+
+def clear_sheet_synced():
+    """Marks every month tab as possibly out of date, e.g. after the task store changed."""
+    cache_invalidate("sheet_synced")
+
+
+def merge_tasks(scope, rows):
+    """
+    Upserts task rows into the store.
+    :param rows: Dicts with id, list_id, name, status, member (bool) and date_updated.
+    :return: The rows that change what the sheet shows (a member task added, removed, renamed, moved or re-statused).
+    """
+    changed = []
+    with _lock:
+        connection = get_connection()
+        for row in rows:
+            old = connection.execute("SELECT list_id, name, status, member FROM tasks WHERE scope = ? AND id = ?", (scope, row["id"])).fetchone()
+            was_member = bool(old and old[3])
+            if row["member"] or was_member:
+                if not old or (old[0], old[1], old[2], was_member) != (row["list_id"], row["name"], row["status"], bool(row["member"])):
+                    changed.append(row)
+            connection.execute(
+                "INSERT OR REPLACE INTO tasks (scope, id, list_id, name, status, member, date_updated) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (scope, row["id"], row["list_id"], row["name"], row["status"], int(bool(row["member"])), row["date_updated"]),
+            )
+        connection.commit()
+    return changed
+
+
+def load_member_tasks(scope):
+    """Returns {list_id: [{"name", "status"}, ...]} for every stored task that belongs on the sheet."""
+    with _lock:
+        rows = get_connection().execute("SELECT list_id, name, status FROM tasks WHERE scope = ? AND member = 1", (scope,)).fetchall()
+    tasks_by_list = {}
+    for list_id, name, status in rows:
+        tasks_by_list.setdefault(list_id, []).append({"name": name, "status": status})
+    return tasks_by_list
@@ -2,16 +2,29 @@ import os
 from dotenv import load_dotenv
 import json
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
-import requests
-import whois
-from tkinter import Tk
-from tkinter.filedialog import askopenfilename
 from ClickupTest.clickupConnect import make_request, CLICKUP_BASE_URL
 
-from .google import update_google_sheet
-
-_latest_wp_version = None
+from .google import update_google_sheet, flush_sheet_writes
+from .versions import get_latest_version
+from .task_model import Task, UNSET, normalize_domain
+from .cache import (
+    cached,
+    cache_get,
+    cache_put,
+    cache_invalidate,
+    get_watermark,
+    set_watermark,
+    reset_task_store,
+    merge_tasks,
+    load_member_tasks,
+    get_synced_lists,
+    add_synced_lists,
+    clear_sheet_synced,
+)
 
 load_dotenv()
 
@@ -19,6 +32,29 @@ load_dotenv()
 USER = os.getenv("CLICKUP_USER_ID")
 STATUS = os.getenv("CLICKUP_STATUS_FILTER")
 TEAM = os.getenv("CLICKUP_TEAM_ID")
+MAX_WORKERS = int(os.getenv("CLICKUP_MAX_WORKERS", "8"))  # Keep at or below CLICKUP_POOL_MAXSIZE
+CLICKUP_BACKEND = os.getenv("CLICKUP_BACKEND", "sync").lower()  # "async" sends the reads through the asyncio client
+TASK_PAGE_SIZE = 100  # ClickUp returns at most 100 tasks per page
+SYNC_MAX_AGE_DAYS = float(os.getenv("CLICKUP_SYNC_MAX_AGE_DAYS", "7"))  # Full re-sync after this, to drop deleted tasks
+WHOIS_TLD_CONCURRENCY = int(os.getenv("WHOIS_TLD_CONCURRENCY", "2"))  # Parallel WHOIS lookups per registry (TLD)
+WHOIS_TLD_INTERVAL = float(os.getenv("WHOIS_TLD_INTERVAL", "1"))  # Seconds between two lookups on the same registry
+
+FIELD_CHECK_DEADLINE = float(os.getenv("FIELD_CHECK_DEADLINE", "2"))  # Seconds the update menu waits for a network-bound field
+
+# Fields whose check goes over the network (wordpress.org, WHOIS), with the seconds display_task_details waits for each
+SLOW_FIELDS = {
+    "WordPress Version": FIELD_CHECK_DEADLINE,
+    "Domain Expiration": FIELD_CHECK_DEADLINE,
+}
+
+# Returned by the update actions when nothing was written to ClickUp, so the local task is still accurate
+UNCHANGED = object()
+
+_whois_throttles = {}
+_whois_throttles_lock = threading.Lock()
+_field_check_executor = None
+_field_checks = {}
+_field_checks_lock = threading.RLock()  # Re-entered when a finished check runs its done callback at once
 
 
 #
@@ -83,70 +119,320 @@ def fetch_all_tasks_by_folder(team_id):
     response = make_request(url)
     if response and "shared" in response and "folders" in response["shared"]:
         folders = response["shared"]["folders"]
+        pairs = [(folder, lst) for folder in folders for lst in folder["lists"]]
+        results, errors = fetch_lists_tasks(pairs, lambda pair: pair[1]["id"])  # Based On Assigned Clickup User
+
+        results = iter(results)
         for folder in folders:
-            # print(f"\nFolder: {folder['name']} (ID: {folder['id']})")
             print(f"\nFolder: {folder['name']}")
             for lst in folder["lists"]:
-                # print(f"  List: {lst['name']} (ID: {lst['id']})")
                 print(f"  List: {lst['name']}")
-                list_sites(lst["id"], [USER])  # Based On Assigned Clickup User
+                print_list_sites(lst["id"], next(results))
+        report_list_errors(errors)
     else:
         print("Failed to fetch folders or no folders found.")
 
 
-def list_sites(list_id, assignee_ids):
+def task_filter_query(assignee_ids):
     """
-    Fetches tasks from a specific ClickUp list filtered by assignee IDs and statuses.
-    :param list_id: The ID of the list in ClickUp.
+    Builds the assignee and status part of a ClickUp task query from CLICKUP_STATUS_FILTER.
     :param assignee_ids: List of assignee IDs to filter tasks.
-    :return: None
+    :return: Query string like "assignees[]=1&statuses[]=open".
     """
-    # Load the CLICKUP_STATUS_FILTER from the environment and format it for the URL
-    status_filter = os.getenv("CLICKUP_STATUS_FILTER", "[]")
-    # Evaluating the string to a list
-    status_filter = eval(status_filter)
-    # Forming the status part of the URL
+    status_filter = json.loads(os.getenv("CLICKUP_STATUS_FILTER", "[]"))
     statuses = "&".join([f"statuses[]={status}" for status in status_filter])
-
-    # Forming the assignee part of the URL
     assignees = "&".join([f"assignees[]={id}" for id in assignee_ids])
+    return f"{assignees}&{statuses}"
 
-    # Constructing the URL with both statuses and assignees
-    url = f"{CLICKUP_BASE_URL}/list/{list_id}/task?{assignees}&{statuses}"
 
-    # Making the request to the ClickUp API
-    response = make_request(url)
+def list_tasks_url(list_id, assignee_ids):
+    """Returns the /list/{id}/task URL filtered by assignee IDs and CLICKUP_STATUS_FILTER."""
+    return f"{CLICKUP_BASE_URL}/list/{list_id}/task?{task_filter_query(assignee_ids)}"
 
-    if response and "tasks" in response:
-        # Output tasks with their names and statuses
-        for task in response["tasks"]:
-            task_status = task.get("status", {}).get("status", "No status found")
-            print(f"      - {task['name']} (Status: {task_status})")
-    else:
+
+def iter_tasks(url, prefetch=True):
+    """
+    Yields every task of a paged ClickUp task endpoint, following page=N until the last page.
+    While the caller works through one page, the next one is already being downloaded,
+    so at most two pages are held in memory.
+    :param url: Task endpoint URL including its filters (without the page parameter).
+    :param prefetch: Download the next page in the background while yielding the current one.
+    :raises RuntimeError: If a page could not be fetched.
+    """
+    separator = "&" if "?" in url else "?"
+
+    def fetch_page(page):
+        response = make_request(f"{url}{separator}page={page}")
+        if response is None or "tasks" not in response:
+            raise RuntimeError(f"Failed to fetch page {page} of {url}")
+        return response
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        page = 0
+        response = fetch_page(page)
+        while True:
+            tasks = response["tasks"]
+            is_last = is_last_page(response)
+            next_response = None
+            if not is_last and executor:
+                next_response = executor.submit(fetch_page, page + 1)
+
+            yield from tasks
+            if is_last:
+                break
+            page += 1
+            response = next_response.result() if next_response else fetch_page(page)
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def is_last_page(response):
+    """ClickUp sends `last_page`; older responses only tell by returning a short page."""
+    if "last_page" in response:
+        return bool(response["last_page"])
+    return len(response["tasks"]) < TASK_PAGE_SIZE
+
+
+def fetch_list_tasks(list_id, assignee_ids):
+    """
+    Fetches every page of a ClickUp list filtered by assignee IDs and statuses.
+    :param list_id: The ID of the list in ClickUp.
+    :param assignee_ids: List of assignee IDs to filter tasks.
+    :return: List of task summaries ({"name", "status"}), built page by page.
+    :raises RuntimeError: If the tasks could not be fetched.
+    """
+    return [summarize_task(task) for task in iter_tasks(list_tasks_url(list_id, assignee_ids))]
+
+
+def fetch_lists_concurrently(items, fetch):
+    """
+    Runs `fetch(item)` for every item on a bounded worker pool.
+    :param items: Lists (or folder/list pairs) to fetch.
+    :param fetch: Callable doing the request for one item.
+    :return: Tuple (results in the same order as `items`, None for failures; list of (item, error)).
+    """
+    results = []
+    errors = []
+    if not items:
+        return results, errors
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(items))) as executor:
+        futures = [executor.submit(fetch, item) for item in items]
+        for item, future in zip(items, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(None)
+                errors.append((item, e))
+    return results, errors
+
+
+def fetch_lists_tasks(items, list_id_of, parse=None):
+    """
+    Fetches the filtered tasks of many lists at once, on worker threads or, with CLICKUP_BACKEND=async,
+    as coroutines on the shared asyncio loop.
+    :param items: Lists (or folder/list pairs) to fetch.
+    :param list_id_of: Returns the ClickUp list ID of an item.
+    :param parse: Applied to every raw task as its page arrives, defaults to summarize_task.
+    :return: Tuple (task lists in the same order as `items`, None for failures; list of (item, error)).
+    """
+    parse = parse or summarize_task
+    if CLICKUP_BACKEND == "async":
+        from . import clickup_async  # Imported here, clickup_async imports this module
+
+        return clickup_async.fetch_lists_tasks(items, list_id_of, [USER], parse)
+    return fetch_lists_concurrently(items, lambda item: [parse(task) for task in iter_tasks(list_tasks_url(list_id_of(item), [USER]))])
+
+
+def report_list_errors(errors):
+    """Prints the lists that could not be fetched during a fan-out."""
+    if not errors:
+        return
+    print(f"\n⚠️ Failed to fetch {len(errors)} list(s):")
+    for item, error in errors:
+        if isinstance(item, tuple):
+            folder, lst = item
+            print(f"  - {folder['name']} / {lst['name']}: {error}")
+        else:
+            print(f"  - {item.get('name', item.get('id'))}: {error}")
+
+
+def print_list_sites(list_id, tasks):
+    """Prints the sites of one list, or a failure notice when `tasks` is None."""
+    if tasks is None:
         print("    No tasks found or failed to fetch tasks for List ID:", list_id)
+        return
+    for task in tasks:
+        print(f"      - {task['name']} (Status: {task['status']})")
+
+
+def list_sites(list_id, assignee_ids):
+    """
+    Fetches tasks from a specific ClickUp list filtered by assignee IDs and statuses.
+    :param list_id: The ID of the list in ClickUp.
+    :param assignee_ids: List of assignee IDs to filter tasks.
+    :return: None
+    """
+    try:
+        tasks = fetch_list_tasks(list_id, assignee_ids)
+    except RuntimeError:
+        tasks = None
+    print_list_sites(list_id, tasks)
 
 
 def return_fetch_all_tasks_by_folder(team_id):
-    print("Retrieving Clickup Data")
     """
     Fetches all tasks grouped by lists in each folder for a given team.
     :param team_id: The ID of the team in ClickUp.
-    :return: List of all folders and their lists with tasks.
+    :return: List of all folders and their lists with tasks, or None if the folders or any list failed to load.
     """
+    print("Retrieving Clickup Data")
     url = f"{CLICKUP_BASE_URL}/team/{team_id}/shared"
     response = make_request(url)
+    if not (response and "shared" in response and "folders" in response["shared"]):
+        # An empty result would look like every row was deleted to the sheet diff
+        print("Failed to fetch folders or no folders found.")
+        return None
+
+    folders = response["shared"]["folders"]
+    pairs = [(folder, lst) for folder in folders for lst in folder["lists"]]
+    results, errors = fetch_lists_tasks(pairs, lambda pair: pair[1]["id"])
+    if errors:
+        # A missing list would look like deleted rows to the sheet diff, so refuse to return partial data
+        report_list_errors(errors)
+        return None
+
+    lists_by_folder = {}
+    for (folder, lst), tasks in zip(pairs, results):
+        lists_by_folder.setdefault(folder["id"], []).append({"name": lst["name"], "tasks": tasks})
     all_folders_data = []
-    if response and "shared" in response and "folders" in response["shared"]:
-        folders = response["shared"]["folders"]
-        for folder in folders:
-            folder_data = {"name": folder["name"], "lists": []}
-            for lst in folder["lists"]:
-                list_data = {"name": lst["name"], "tasks": return_list_sites(lst["id"], [USER])}
-                folder_data["lists"].append(list_data)
-            all_folders_data.append(folder_data)
+    for folder in folders:
+        all_folders_data.append({"name": folder["name"], "lists": lists_by_folder.get(folder["id"], [])})
     return all_folders_data
 
 
+def return_fetch_all_tasks_by_team(team_id):
+    """
+    Same result as return_fetch_all_tasks_by_folder, but fetched with ClickUp's team-level
+    task search (one paged /team/{id}/task query) instead of one request per list.
+    :param team_id: The ID of the team in ClickUp.
+    :return: List of all folders and their lists with tasks, or None if the search failed.
+    """
+    print("Retrieving Clickup Data")
+    url = f"{CLICKUP_BASE_URL}/team/{team_id}/shared"
+    response = make_request(url)
+    if not (response and "shared" in response and "folders" in response["shared"]):
+        print("Failed to fetch folders or no folders found.")
+        return None
+
+    folders = response["shared"]["folders"]
+    list_ids = [lst["id"] for folder in folders for lst in folder["lists"]]
+    tasks_by_list = {}
+    if list_ids:
+        lists_query = "&".join([f"list_ids[]={id}" for id in list_ids])
+        search_url = f"{CLICKUP_BASE_URL}/team/{team_id}/task?{lists_query}&{task_filter_query([USER])}"
+        try:
+            for task in iter_tasks(search_url):
+                tasks_by_list.setdefault(task.get("list", {}).get("id"), []).append(summarize_task(task))
+        except RuntimeError as e:
+            print(f"⚠️ {e}")
+            return None
+
+    # Group the flat search results back into the folder -> list -> tasks structure
+    return [
+        {"name": folder["name"], "lists": [{"name": lst["name"], "tasks": tasks_by_list.get(lst["id"], [])} for lst in folder["lists"]]}
+        for folder in folders
+    ]
+
+
+def return_sync_tasks_by_team(team_id):
+    """
+    Incremental version of return_fetch_all_tasks_by_team.
+    Only tasks updated since the stored date_updated watermark are requested; they are merged into the
+    local task store and the sheet data is rebuilt from that store. ClickUp does not report deleted
+    tasks, so a full sync is forced every CLICKUP_SYNC_MAX_AGE_DAYS. Lists the store has not seen yet (e.g. newly
+    shared ones) get a full fetch of their own, since their tasks can be older than the watermark.
+    :param team_id: The ID of the team in ClickUp.
+    :return: Tuple (folders with their lists and tasks, list of changed task rows), or (None, None) on failure.
+    """
+    print("Retrieving Clickup Data")
+    url = f"{CLICKUP_BASE_URL}/team/{team_id}/shared"
+    response = make_request(url)
+    if not (response and "shared" in response and "folders" in response["shared"]):
+        return None, None
+
+    folders = response["shared"]["folders"]
+    status_filter = json.loads(os.getenv("CLICKUP_STATUS_FILTER", "[]"))
+    scope = f"team:{team_id}|user:{USER}|statuses:{','.join(status_filter)}"
+
+    watermark, synced_at = get_watermark(scope)
+    if watermark is not None and time.time() - synced_at > SYNC_MAX_AGE_DAYS * 86400:
+        print("Last full sync is too old, fetching everything again.")
+        reset_task_store(scope)
+        watermark = None
+
+    list_ids = [str(lst["id"]) for folder in folders for lst in folder["lists"]]
+    synced_lists = get_synced_lists(scope) if watermark is not None else set()
+    new_list_ids = [id for id in list_ids if id not in synced_lists]
+    changed = []
+    if list_ids:
+        search_urls = []
+        if new_list_ids:
+            # Full sync of the lists never synced before: only the tasks that belong on the sheet
+            lists_query = "&".join([f"list_ids[]={id}" for id in new_list_ids])
+            search_urls.append(f"{CLICKUP_BASE_URL}/team/{team_id}/task?{lists_query}&{task_filter_query([USER])}")
+        if watermark is not None:
+            # Delta: every task touched since the watermark, so we also see tasks leaving the filter
+            lists_query = "&".join([f"list_ids[]={id}" for id in list_ids if id in synced_lists])
+            if lists_query:
+                search_urls.append(f"{CLICKUP_BASE_URL}/team/{team_id}/task?{lists_query}&include_closed=true&date_updated_gt={watermark}")
+
+        rows = []
+        newest = watermark or 0
+        try:
+            for task in (task for search_url in search_urls for task in iter_tasks(search_url)):
+                status = task.get("status", {}).get("status", "No status found")
+                assigned = any(str(assignee.get("id")) == str(USER) for assignee in task.get("assignees", []))
+                date_updated = int(task.get("date_updated") or 0)
+                rows.append(
+                    {
+                        "id": task["id"],
+                        "list_id": task.get("list", {}).get("id"),
+                        "name": task["name"],
+                        "status": status,
+                        "member": assigned and status in status_filter,
+                        "date_updated": date_updated,
+                    }
+                )
+                newest = max(newest, date_updated)
+        except RuntimeError as e:
+            print(f"⚠️ {e}")
+            return None, None
+
+        changed = merge_tasks(scope, rows)
+        if changed:
+            clear_sheet_synced()  # The sheet must be diffed again even if this run never reaches it
+        add_synced_lists(scope, new_list_ids)
+        if watermark is None:
+            set_watermark(scope, newest, time.time())
+        else:
+            set_watermark(scope, newest)
+        print(f"{len(rows)} task(s) fetched, {len(changed)} change(s) for the sheet.")
+
+    tasks_by_list = load_member_tasks(scope)
+    folders_data = [
+        {"name": folder["name"], "lists": [{"name": lst["name"], "tasks": tasks_by_list.get(lst["id"], [])} for lst in folder["lists"]]}
+        for folder in folders
+    ]
+    return folders_data, changed
+
+
+def summarize_task(task):
+    """Reduces a ClickUp task to the name/status pair used for the Google Sheet."""
+    return {"name": task["name"], "status": task.get("status", {}).get("status", "No status found")}
+
+
 def return_list_sites(list_id, assignee_ids):
     """
     Fetches tasks from a specific ClickUp list filtered by assignee IDs and statuses.
@@ -154,16 +440,9 @@ def return_list_sites(list_id, assignee_ids):
     :param assignee_ids: List of assignee IDs to filter tasks.
     :return: List of dictionaries, each representing a task.
     """
-    status_filter = os.getenv("CLICKUP_STATUS_FILTER", "[]")
-    status_filter = eval(status_filter)  # Consider safety or alternatives like json.loads if possible
-    statuses = "&".join([f"statuses[]={status}" for status in status_filter])
-    assignees = "&".join([f"assignees[]={id}" for id in assignee_ids])
-    url = f"{CLICKUP_BASE_URL}/list/{list_id}/task?{assignees}&{statuses}"
-
-    response = make_request(url)
-    if response and "tasks" in response:
-        return [{"name": task["name"], "status": task.get("status", {}).get("status", "No status found")} for task in response["tasks"]]
-    else:
+    try:
+        return fetch_list_tasks(list_id, assignee_ids)
+    except RuntimeError:
         return []
 
 
@@ -176,10 +455,14 @@ def return_list_sites(list_id, assignee_ids):
 #
 
 
-def list_folders():
+def list_folders(refresh=False):
     url = f"{CLICKUP_BASE_URL}/team/{TEAM}/shared"
-    response = make_request(url)  # Ensure make_request returns the API response
+    response = cached("folders", url, lambda: make_request(url), refresh)  # Served from the local cache while fresh
+    return show_folders(response)
+
 
+def show_folders(response):
+    """Prints the numbered folder menu from a /team/{id}/shared response and returns the folders."""
     # Access the nested 'folders' key inside 'shared'
     if response and "shared" in response and "folders" in response["shared"]:
         folders = response["shared"]["folders"]
@@ -196,11 +479,14 @@ def list_folders():
         return None
 
 
-def list_lists(folder_id):
+def list_lists(folder_id, refresh=False):
     url = f"{CLICKUP_BASE_URL}/folder/{folder_id}/list"  # Make sure the endpoint is correct
-    response = make_request(url)
+    response = cached("lists", url, lambda: make_request(url), refresh)
+    return show_lists(response)
 
-    # You need to assign the response from make_request to a variable, typically 'response' is used
+
+def show_lists(response):
+    """Prints the numbered list menu from a /folder/{id}/list response and returns the lists."""
     if response and "lists" in response:
         lists = response["lists"]
         if lists:
@@ -216,21 +502,34 @@ def list_lists(folder_id):
         return None
 
 
-def list_sites_maintenance(list_id, assignee_ids=[USER]):
+def list_sites_maintenance(list_id, assignee_ids=[USER], refresh=False):
     """
     Fetches tasks from a specific ClickUp list filtered by assignee IDs and statuses.
+    Only the id/name/status of each task is kept, and cached for CACHE_TTL_SITES.
     """
     try:
-        status_filter = json.loads(os.getenv("CLICKUP_STATUS_FILTER", "[]"))
+        url = list_tasks_url(list_id, assignee_ids)
     except json.JSONDecodeError:
         print("Error decoding the CLICKUP_STATUS_FILTER. Please check its format.")
         return []
 
-    statuses = "&".join(f"statuses[]={status}" for status in status_filter)
-    assignees = "&".join(f"assignees[]={id}" for id in assignee_ids)
-    url = f"{CLICKUP_BASE_URL}/list/{list_id}/task?{assignees}&{statuses}"
+    def fetch():
+        try:
+            return {"tasks": [compact_task(task) for task in iter_tasks(url)]}
+        except RuntimeError:
+            return None
 
-    response = make_request(url)
+    response = cached("sites", url, fetch, refresh)
+    return show_sites(list_id, response)
+
+
+def compact_task(task):
+    """Keeps only what the site menu needs from a ClickUp task."""
+    return {"id": task["id"], "name": task["name"], "status": {"status": task.get("status", {}).get("status", "No status found")}}
+
+
+def show_sites(list_id, response):
+    """Prints the numbered site menu from a /list/{id}/task response and returns the tasks."""
     if response and "tasks" in response:
         tasks = response["tasks"]
         if tasks:
@@ -247,17 +546,28 @@ def list_sites_maintenance(list_id, assignee_ids=[USER]):
         return []
 
 
-def get_task(task_id):
+def get_task(task_id, quiet=False):
+    """
+    Fetches and parses one task.
+    :param quiet: Return None on failure without printing anything (background prefetching).
+    """
     url = f"{CLICKUP_BASE_URL}/task/{task_id}"
     try:
-        response = make_request(url)  # Ensure make_request returns the API response properly
-        if response:
-            # Directly return the response if it does not use a 'task' key
-            return response
-        else:
-            print(f"No response or invalid response received from API for Task ID {task_id}.")
+        response = make_request(url, quiet=quiet)  # Ensure make_request returns the API response properly
+        return check_task(task_id, response, quiet)
     except Exception as e:
-        print(f"An error occurred while fetching task: {e}")
+        if not quiet:
+            print(f"An error occurred while fetching task: {e}")
+    return None
+
+
+def check_task(task_id, response, quiet=False):
+    """Returns the Task parsed from a /task/{id} response, reporting an empty or failed response."""
+    if response:
+        # Directly parse the response if it does not use a 'task' key
+        return Task(response)
+    if not quiet:
+        print(f"No response or invalid response received from API for Task ID {task_id}.")
     return None
 
 
@@ -273,8 +583,15 @@ def display_task_details(task):
         "8. Domain Expiration": "Domain Expiration",
     }
 
+    # The network-bound checks start first and run in the background while the rest is printed
+    checks = {key: start_field_check(task, field_name) for key, field_name in fields_to_display.items() if field_name in SLOW_FIELDS}
+
     for key, field_name in fields_to_display.items():
-        value = get_custom_field_value(task, field_name)
+        if key in checks:
+            check = checks[key]
+            value = field_check_result(check) if check.done() else "⏳ pending"
+        else:
+            value = get_custom_field_value(task, field_name)
 
         if key == "6. Notes for Maintenance":
             print("{:<50} {}".format(key + ":", value))
@@ -282,8 +599,62 @@ def display_task_details(task):
         else:
             print("{:<50} {}".format(key + ":", value))
 
+    # Fill in the pending checks as they finish, each one waited on until its own deadline at most
+    started = time.monotonic()
+    pending = {key: check for key, check in checks.items() if not check.done()}
+    while pending:
+        deadline = min(SLOW_FIELDS[fields_to_display[key]] for key in pending)
+        done, _ = wait(pending.values(), timeout=max(0, started + deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+        for key, check in list(pending.items()):
+            if check in done:
+                print("{:<50} {}".format(key + ":", field_check_result(check)))
+            elif time.monotonic() - started >= SLOW_FIELDS[fields_to_display[key]]:
+                print("{:<50} {}".format(key + ":", "⌛ timed out (still checking, shown on the next refresh)"))
+            else:
+                continue
+            del pending[key]
+
+
+def warm_task_checks(task):
+    """Runs the lookups behind SLOW_FIELDS for a task ahead of time, so its update menu finds them cached."""
+    if task.field("WordPress Version") is not None:
+        get_latest_wp_version()
+    if task.field("Domain Expiration") is not None and task.domain:
+        get_dns_expiry(task.domain)
+
+
+def start_field_check(task, field_name):
+    """
+    Evaluates get_custom_field_value(task, field_name) on the background pool.
+    A check still running for the same task and value is reused instead of being started again.
+    """
+    global _field_check_executor
+    key = (task.id, field_name, repr(task.value(field_name)), task.domain if field_name == "Domain Expiration" else None)
+    with _field_checks_lock:
+        check = _field_checks.get(key)
+        if check is None or check.done():
+            if _field_check_executor is None:
+                _field_check_executor = ThreadPoolExecutor(max_workers=len(SLOW_FIELDS) * 2, thread_name_prefix="field-check")
+            check = _field_check_executor.submit(get_custom_field_value, task, field_name)
+            _field_checks[key] = check
+            check.add_done_callback(lambda _: forget_field_check(key, check))
+        return check
+
+
+def field_check_result(check):
+    try:
+        return check.result()
+    except Exception as e:
+        return f"⚠️ Check failed | {e}"
+
+
+def forget_field_check(key, check):
+    with _field_checks_lock:
+        if _field_checks.get(key) is check:
+            del _field_checks[key]
+
 
-def analyze_notes_for_maintenance(task, notes_text):
+def analyze_notes_for_maintenance(task, notes_text, show=True):
     current_year = str(datetime.now().year)
     current_month = str(datetime.now().month).zfill(2)  # Ensure "04" instead of "4"
 
@@ -308,8 +679,9 @@ def analyze_notes_for_maintenance(task, notes_text):
             else:
                 slider_status = "❌ Outdated"
 
-    print("{:<50} {}".format("      6.1 Footer updated this year:", footer_status))
-    print("{:<50} {}".format("      6.2 Slider Revolution updated:", slider_status))
+    if show:
+        print("{:<50} {}".format("      6.1 Footer updated this year:", footer_status))
+        print("{:<50} {}".format("      6.2 Slider Revolution updated:", slider_status))
     note_values = [footer_status, slider_status]
     return note_values
 
@@ -327,50 +699,105 @@ def show_broken_links(task, passed, failed):
     current_month = datetime.utcnow().month
     current_year = datetime.utcnow().year
 
-    for field in task.get("custom_fields", []):
-        if field["name"] == "Broken Links Report":
-            attachments = field.get("value", [])
-            if not attachments:
-                return "Empty"  # No prefix if nothing has been uploaded
+    if task.field("Broken Links Report") is None:
+        return failed + "Field Not Found"
 
-            try:
-                most_recent_report = attachments[0]
-                report_date_ms = int(most_recent_report["date"])
-                report_date = datetime.utcfromtimestamp(report_date_ms / 1000)
+    attachments = task.attachments("Broken Links Report")
+    if not attachments:
+        return "Empty"  # No prefix if nothing has been uploaded
 
-                prefix = passed if (report_date.year == current_year and report_date.month == current_month) else failed
+    try:
+        most_recent_report = attachments[0]
+        report_date_ms = int(most_recent_report["date"])
+        report_date = datetime.utcfromtimestamp(report_date_ms / 1000)
 
-                return prefix + report_date.strftime("%m|%d|%Y")
-            except (KeyError, ValueError, IndexError):
-                return failed + "Invalid Report Format"
+        prefix = passed if (report_date.year == current_year and report_date.month == current_month) else failed
 
-    return failed + "Field Not Found"
+        return prefix + report_date.strftime("%m|%d|%Y")
+    except (KeyError, ValueError, IndexError):
+        return failed + "Invalid Report Format"
 
 
 def get_latest_wp_version():
-    global _latest_wp_version
-    if _latest_wp_version:
-        return _latest_wp_version
-    try:
-        response = requests.get("https://api.wordpress.org/core/version-check/1.7/")
-        response.raise_for_status()
-        data = response.json()
-        _latest_wp_version = data["offers"][0]["current"]
-        return _latest_wp_version
-    except Exception as e:
+    """Latest WordPress core version, served from the shared version cache (see versions.py)."""
+    return get_latest_version("wordpress")
+
+
+def whois_throttle(domain):
+    """
+    Returns the (semaphore, state) pair throttling lookups on the registry of `domain`.
+    Registries rate-limit aggressively, so each TLD gets its own small concurrency and spacing budget.
+    """
+    tld = domain.rsplit(".", 1)[-1]
+    with _whois_throttles_lock:
+        if tld not in _whois_throttles:
+            _whois_throttles[tld] = (threading.Semaphore(WHOIS_TLD_CONCURRENCY), {"lock": threading.Lock(), "next": 0.0})
+        return _whois_throttles[tld]
+
+
+def lookup_whois(domain):
+    """Runs one WHOIS query for `domain`, respecting its registry's throttle. Returns the expiry datetime or None."""
+    import whois  # Imported on first lookup, it is slow to load and only needed here
+
+    semaphore, state = whois_throttle(domain)
+    with semaphore:
+        with state["lock"]:
+            wait = state["next"] - time.monotonic()
+            state["next"] = max(state["next"], time.monotonic()) + WHOIS_TLD_INTERVAL
+        if wait > 0:
+            time.sleep(wait)
+        try:
+            domain_info = whois.whois(domain)
+            expiration_date = domain_info.expiration_date
+            if isinstance(expiration_date, list):
+                expiration_date = expiration_date[0]
+            if expiration_date and not isinstance(expiration_date, datetime):
+                expiration_date = datetime.combine(expiration_date, datetime.min.time())
+            return expiration_date
+        except Exception as e:
+            return None  # fail silently for now
+
+
+def get_dns_expiry(domain, refresh=False):
+    """
+    Retrieve the domain expiration date using WHOIS.
+    Results are cached on disk per normalized domain for CACHE_TTL_WHOIS seconds,
+    failed lookups for CACHE_TTL_WHOIS_MISS seconds.
+    :param refresh: Skip the cache and query WHOIS again.
+    """
+    domain = normalize_domain(domain)
+    if not domain:
         return None
+    if not refresh:
+        if cache_get("whois_miss", domain) is not None:
+            return None
+        entry = cache_get("whois", domain)
+        if entry is not None:
+            return datetime.fromisoformat(entry["expiration_date"])
+
+    expiration_date = lookup_whois(domain)
+    if expiration_date:
+        cache_put("whois", domain, {"expiration_date": expiration_date.isoformat()})
+        cache_invalidate("whois_miss", domain)
+    else:
+        cache_put("whois_miss", domain, {})
+    return expiration_date
 
 
-def get_dns_expiry(domain):
-    """Retrieve the domain expiration date using WHOIS."""
-    try:
-        domain_info = whois.whois(domain)
-        expiration_date = domain_info.expiration_date
-        if isinstance(expiration_date, list):
-            expiration_date = expiration_date[0]
-        return expiration_date
-    except Exception as e:
-        return None  # fail silently for now
+def refresh_domain_expiries(tasks, refresh=False):
+    """
+    Looks up the domain expiry of every task concurrently (throttled per registry) and stores it in the cache,
+    so later Domain Expiration checks are answered without WHOIS.
+    :param tasks: Task objects (see task_model.py).
+    :param refresh: Query WHOIS even for domains that are still cached.
+    :return: {domain: expiration datetime or None}
+    """
+    domains = sorted({task.domain for task in tasks if task.domain})
+    if not domains:
+        return {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        expiries = list(executor.map(lambda domain: get_dns_expiry(domain, refresh), domains))
+    return dict(zip(domains, expiries))
 
 
 def get_custom_field_value(task, field_name, debug=False):
@@ -380,97 +807,91 @@ def get_custom_field_value(task, field_name, debug=False):
     if field_name == "Broken Links Report":
         return show_broken_links(task, passed, failed)
 
-    # Loop once through all custom fields
-    for field in task.get("custom_fields", []):
-        if field.get("name") != field_name:
-            continue
+    # One indexed lookup instead of a scan of the custom fields
+    field = task.field(field_name)
+    if field is None:
+        return "No data"
 
-        value = field.get("value", "Not specified")
+    value = "Not specified" if field.value is UNSET else field.value
 
-        # === Special Case: Date Completed ===
-        if field_name == "Date Completed":
-            if debug:
-                print("RAW Date Completed value:", value)
-
-            try:
-                # ClickUp provides timestamp in ms
-                timestamp = int(value) / 1000
-                completed_date = datetime.fromtimestamp(timestamp)
-                now = datetime.now()
-                is_this_month = completed_date.month == now.month and completed_date.year == now.year
-                prefix = passed if is_this_month else failed
-                return prefix + completed_date.strftime("%m|%d|%Y")
-            except Exception as e:
-                return f"⚠️ Invalid timestamp | {value}"
+    # === Special Case: Date Completed ===
+    if field_name == "Date Completed":
+        if debug:
+            print("RAW Date Completed value:", value)
 
-        # === Special Case: Date for Email Subject Line (Month & Year) ===
-        if field_name == "Date for Email Subject Line (Month & Year)":
-            if debug:
-                print("RAW Date for Email Subject Line (Month & Year) value:", value)
-
-            try:
-                # Parse string like "February 2025"
-                field_date = datetime.strptime(value, "%B %Y")
-                now = datetime.now()
-                is_this_month = field_date.month == now.month and field_date.year == now.year
-                prefix = passed if is_this_month else failed
-                return prefix + value
-            except Exception as e:
-                return f"⚠️ Invalid format | {value}"
-
-        # === Special Case: WordPress Version ===
-        if field_name == "WordPress Version":
-            if debug:
-                print("RAW WordPress Version value:", value)
-
-            latest_version = get_latest_wp_version()
-            if latest_version:
-                is_current = value.strip() == latest_version.strip()
-                prefix = passed if is_current else failed
-                return prefix + value
-            else:
-                return f"⚠️ Could not fetch latest version | {value}"
-
-        # === Special Case: Domain Expiration ===
-        if field_name == "Domain Expiration":
-            try:
-                # Convert ClickUp expiration timestamp (in ms) to datetime
-                clickup_exp = datetime.fromtimestamp(int(value) / 1000).date()
+        try:
+            # ClickUp provides timestamp in ms
+            completed_date = task.date(field_name)
+            now = datetime.now()
+            is_this_month = completed_date.month == now.month and completed_date.year == now.year
+            prefix = passed if is_this_month else failed
+            return prefix + completed_date.strftime("%m|%d|%Y")
+        except Exception as e:
+            return f"⚠️ Invalid timestamp | {value}"
+
+    # === Special Case: Date for Email Subject Line (Month & Year) ===
+    if field_name == "Date for Email Subject Line (Month & Year)":
+        if debug:
+            print("RAW Date for Email Subject Line (Month & Year) value:", value)
 
-                # Extract domain from Website URL field
-                domain = None
-                for f in task.get("custom_fields", []):
-                    if f["name"] == "Website URL":
-                        domain = f.get("value", "").replace("https://", "").replace("http://", "").strip("/")
-                        break
+        try:
+            # Parse string like "February 2025"
+            field_date = datetime.strptime(value, "%B %Y")
+            now = datetime.now()
+            is_this_month = field_date.month == now.month and field_date.year == now.year
+            prefix = passed if is_this_month else failed
+            return prefix + value
+        except Exception as e:
+            return f"⚠️ Invalid format | {value}"
+
+    # === Special Case: WordPress Version ===
+    if field_name == "WordPress Version":
+        if debug:
+            print("RAW WordPress Version value:", value)
+
+        latest_version = get_latest_wp_version()
+        if latest_version:
+            is_current = value.strip() == latest_version.strip()
+            prefix = passed if is_current else failed
+            return prefix + value
+        else:
+            return f"⚠️ Could not fetch latest version | {value}"
 
-                whois_exp = get_dns_expiry(domain).date() if domain else None
+    # === Special Case: Domain Expiration ===
+    if field_name == "Domain Expiration":
+        try:
+            # Convert ClickUp expiration timestamp (in ms) to datetime
+            clickup_exp = datetime.fromtimestamp(int(value) / 1000).date()
 
-                if not whois_exp:
-                    return failed + "WHOIS lookup failed"
+            # Extract domain from Website URL field
+            domain = task.domain
+            whois_exp = get_dns_expiry(domain) if domain else None
+            whois_exp = whois_exp.date() if whois_exp else None
 
-                if whois_exp != clickup_exp:
-                    return failed + f"WHOIS: {whois_exp.strftime('%m/%d/%Y')} ≠ ClickUp: {clickup_exp.strftime('%m/%d/%Y')}"
+            if not whois_exp:
+                return failed + "WHOIS lookup failed"
 
-                return passed + whois_exp.strftime("%m/%d/%Y")
+            if whois_exp != clickup_exp:
+                return failed + f"WHOIS: {whois_exp.strftime('%m/%d/%Y')} ≠ ClickUp: {clickup_exp.strftime('%m/%d/%Y')}"
 
-            except Exception as e:
-                return f"⚠️ Error comparing expiration: {e}"
+            return passed + whois_exp.strftime("%m/%d/%Y")
 
-        return value
+        except Exception as e:
+            return f"⚠️ Error comparing expiration: {e}"
 
-    return "No data"
+    return value
 
 
 def get_field_id_by_name(task, field_name):
-    custom_fields = task.get("custom_fields", [])
-    for field in custom_fields:
-        if field["name"] == field_name:
-            return field["id"]
-    return None
+    return task.field_id(field_name)
 
 
 def update_custom_field(task_id, field_id, value, value_type=None):
+    """
+    Writes a custom field of a task, building the final value from `value` according to `value_type`.
+    :return: The value written (to patch into the local Task), UNCHANGED if the input was rejected before
+             anything was sent, or None if ClickUp did not accept the write.
+    """
     url = f"{CLICKUP_BASE_URL}/task/{task_id}/field/{field_id}"
 
     if value_type == "plugin":
@@ -528,19 +949,24 @@ def update_custom_field(task_id, field_id, value, value_type=None):
             value = int(dt.timestamp()) * 1000
         except ValueError:
             print("Invalid date format. Please use YYYY-MM-DD.")
-            return
+            return UNCHANGED
 
     payload = {"value": value}
 
     response = make_request(url, "post", payload)
     if response is not None:
         print("Field updated successfully.")
+        return value
     else:
         print("Failed to update field. Please try again later.")
+        return None
 
 
 def select_file_gui():
     """Open a file selection dialog and return the selected file path."""
+    from tkinter import Tk
+    from tkinter.filedialog import askopenfilename
+
     root = Tk()
     root.withdraw()  # Hide the main tkinter window
     downloads_path = os.path.expanduser("~/Downloads")
@@ -551,6 +977,7 @@ def select_file_gui():
 
 def upload_file_to_clickup(task_id, field_id, file_path):
     update_custom_field(task_id, field_id, file_path, "attachment")
+    return None  # The field's new attachment list is only known to ClickUp, so the task has to be fetched again
 
 
 def update_plugins(site_name, task_id, field_id):
@@ -568,10 +995,11 @@ def update_plugins(site_name, task_id, field_id):
 
         # Call the function to update Google Sheets
         update_google_sheet(site_name, successful_updates, "Plugins Updated")
-        update_custom_field(task_id, field_id, successful_updates, "plugin")
+        return update_custom_field(task_id, field_id, successful_updates, "plugin")
 
     except ValueError:
         print("⚠️ Please enter valid numbers only.")
+        return UNCHANGED
 
 
 def maintenance_notes(site_name, task_id, field_id, text):
@@ -582,18 +1010,18 @@ def maintenance_notes(site_name, task_id, field_id, text):
         update_input = input("Which to update? ").strip()
 
         if update_input == ".":
-            break
+            return UNCHANGED
 
         if update_input == "1":
             update_google_sheet(site_name, None, "Footer 2025")
-            break
+            return UNCHANGED
 
         elif update_input == "2":
             updated_text = input("Type your note to append to clickup: ").strip()
             texts = [text, updated_text]
-            update_custom_field(task_id, field_id, texts, "note")
+            value = update_custom_field(task_id, field_id, texts, "note")
             update_google_sheet(site_name, updated_text, "Notes")
-            break
+            return value
 
         else:
             print("Not a valid choice.")
@@ -605,7 +1033,7 @@ def update_footer(site_name, task_id, field_id, text):
     updated_text = f"Updated Copyright footer {current_year}"
     update_google_sheet(site_name, "Done", "Footer 2025")
     texts = [text, updated_text]
-    update_custom_field(task_id, field_id, texts, "footer")
+    return update_custom_field(task_id, field_id, texts, "footer")
 
 
 def update_slider(site_name, task_id, field_id, text):
@@ -614,47 +1042,46 @@ def update_slider(site_name, task_id, field_id, text):
     updated_text = f"Updated Slider Revolution {current_date}"
     update_google_sheet(site_name, "Done", "Slider Rev Update")
     texts = [text, updated_text]
-    update_custom_field(task_id, field_id, texts, "slider")
+    return update_custom_field(task_id, field_id, texts, "slider")
 
 
 def date_completed(task_id, field_id):
     print("Updating Date Completed Field")
     today = datetime.now()
     timestamp = int(today.timestamp() * 1000)  # Convert to milliseconds
-    update_custom_field(task_id, field_id, timestamp)
+    return update_custom_field(task_id, field_id, timestamp)
 
 
 def date_email_subject_line(task_id, field_id):
     print("Updating Date for Email Subject Field")
     today = datetime.now()
     value = today.strftime("%B %Y")  # Output will be like "April 2025"
-    update_custom_field(task_id, field_id, value)
+    return update_custom_field(task_id, field_id, value)
 
 
 def wordpress_version(task_id, field_id):
     print("Updating WordPress Version Field")
     latest_version = get_latest_wp_version()
+    if not latest_version:
+        print("Could not fetch the latest WordPress version.")
+        return UNCHANGED
     value = latest_version.strip()
-    update_custom_field(task_id, field_id, value)
+    return update_custom_field(task_id, field_id, value)
 
 
 def domain_exp(site_name, task, task_id, field_id):
     print("Updating Domain Expiration Field")
     # Extract domain from Website URL field
-    domain = None
-    for f in task.get("custom_fields", []):
-        if f["name"] == "Website URL":
-            domain = f.get("value", "").replace("https://", "").replace("http://", "").strip("/")
-            break
+    domain = task.domain
     if not domain:
         print("Domain not found.")
-        return
+        return UNCHANGED
 
     whois_exp = get_dns_expiry(domain)  # Assume this returns a datetime or date
 
     if not whois_exp:
         print("Could not retrieve WHOIS expiration date.")
-        return
+        return UNCHANGED
 
     if isinstance(whois_exp, datetime):
         dt = whois_exp
@@ -663,7 +1090,7 @@ def domain_exp(site_name, task, task_id, field_id):
         dt = datetime.combine(whois_exp, datetime.min.time())
     update_google_sheet(site_name, "Done", "Slider Rev Update")
     timestamp = int(dt.timestamp() * 1000)  # Convert to milliseconds
-    update_custom_field(task_id, field_id, timestamp)
+    return update_custom_field(task_id, field_id, timestamp)
 
 
 def filter_clickup_values(clickup_values):
@@ -688,7 +1115,12 @@ def filter_clickup_values(clickup_values):
     return filtered_values
 
 
-def clickup_sync_google(site_name, task):
+# Month sheet columns filled from ClickUp, in the order sync_values() returns them
+SYNC_COLUMNS = ["Broken Links", "Plugins Updated", "DNS Check", "Footer 2025", "Slider Rev Update"]
+
+
+def sync_values(task, show_notes=True):
+    """Computes the sheet values of SYNC_COLUMNS for one task from its custom fields."""
     # Define only the fields you want to fetch and display
     fields_to_display = {
         "1. Broken Links Report": "Broken Links Report",
@@ -701,7 +1133,7 @@ def clickup_sync_google(site_name, task):
     for key, field_name in fields_to_display.items():
         value = get_custom_field_value(task, field_name)
         if key == "Notes for Maintenance":
-            note_values = analyze_notes_for_maintenance(task, value)  # Show subitems like 6.1, 6.2
+            note_values = analyze_notes_for_maintenance(task, value, show_notes)  # Show subitems like 6.1, 6.2
             footer_value, slider_value = note_values
             clickup_values.append(footer_value)
             clickup_values.append(slider_value)
@@ -709,13 +1141,72 @@ def clickup_sync_google(site_name, task):
             clickup_values.append(value)
 
     # 🔍 Apply filtering logic
-    filtered_values = filter_clickup_values(clickup_values)
+    return filter_clickup_values(clickup_values)
 
-    update_google_sheet(site_name, filtered_values[0], "Broken Links")
-    update_google_sheet(site_name, filtered_values[1], "Plugins Updated")
-    update_google_sheet(site_name, filtered_values[2], "DNS Check")
-    update_google_sheet(site_name, filtered_values[3], "Footer 2025")
-    update_google_sheet(site_name, filtered_values[4], "Slider Rev Update")
+
+def clickup_sync_google(site_name, task):
+    filtered_values = sync_values(task)
+    for column_name, value in zip(SYNC_COLUMNS, filtered_values):
+        update_google_sheet(site_name, value, column_name)
+
+
+def fetch_assigned_tasks(team_id):
+    """
+    Returns every task assigned to CLICKUP_USER_ID with its custom fields, reading the lists concurrently.
+    :return: List of Task, or None if nothing was found.
+    """
+    print("Retrieving Clickup Data")
+    url = f"{CLICKUP_BASE_URL}/team/{team_id}/shared"
+    response = make_request(url)
+    if not (response and "shared" in response and "folders" in response["shared"]):
+        print("Failed to fetch folders or no folders found.")
+        return None
+
+    lists = [lst for folder in response["shared"]["folders"] for lst in folder["lists"]]
+    # Parsed inside the per-list fetch, page by page, so the raw JSON of a whole list is never held at once
+    results, errors = fetch_lists_tasks(lists, lambda lst: lst["id"], Task)
+    report_list_errors(errors)
+    tasks = [task for tasks in results if tasks for task in tasks]
+    if not tasks:
+        print("No assigned sites found.")
+        return None
+    return tasks
+
+
+def refresh_all_domain_expiries(team_id):
+    """Re-queries WHOIS for the domain of every assigned site, so the update menu finds them all cached."""
+    tasks = fetch_assigned_tasks(team_id)
+    if not tasks:
+        return
+    print(f"Looking up domain expiries for {len(tasks)} site(s)...")
+    expiries = refresh_domain_expiries(tasks, refresh=True)
+    failed = [domain for domain, expiry in expiries.items() if expiry is None]
+    for domain in failed:
+        print(f"  ❌ WHOIS lookup failed: {domain}")
+    print(f"Cached {len(expiries) - len(failed)} of {len(expiries)} domain expiry date(s).")
+
+
+def sync_all_sites_to_google(team_id):
+    """
+    Bulk version of clickup_sync_google for every site assigned to CLICKUP_USER_ID.
+    Lists are read concurrently (their tasks already carry the custom fields, so no get_task per site),
+    the per-site checks run side by side, and every cell is sent in one batched sheet update.
+    :param team_id: The ID of the team in ClickUp.
+    """
+    tasks = fetch_assigned_tasks(team_id)
+    if not tasks:
+        return
+
+    print(f"Checking {len(tasks)} site(s)...")
+    refresh_domain_expiries(tasks)  # Warm the WHOIS cache for every domain first, throttled per registry
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        all_values = list(executor.map(lambda task: sync_values(task, show_notes=False), tasks))
+
+    for task, filtered_values in zip(tasks, all_values):
+        for column_name, value in zip(SYNC_COLUMNS, filtered_values):
+            update_google_sheet(task.name, value, column_name, show=False, debounce=False)  # Flushed once below
+    flush_sheet_writes()
+    print(f"Synced {len(tasks)} site(s) to Google Sheets.")
 
 
 def change_clickup_status(site_name, task_id):
@@ -731,8 +1222,13 @@ def change_clickup_status(site_name, task_id):
         url = f"{CLICKUP_BASE_URL}/task/{task_id}"
         payload = {"status": selected_status}
         print(f"You selected: {selected_status}")
-        make_request(url, "put", payload)
+        if make_request(url, "put", payload) is None:
+            print("Failed to update the task status. Please try again later.")
+            return None
+        cache_invalidate("sites")  # Site menus show the status, so drop them
         update_google_sheet(site_name, selected_status, "Status")
         print("Task status updated successfully!")
+        return selected_status
     else:
         print("Invalid choice. Please enter a number from the list.")
+        return UNCHANGED
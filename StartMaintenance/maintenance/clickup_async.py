@@ -0,0 +1,165 @@
+import asyncio
+import json
+from ClickupTest.clickupConnect import CLICKUP_BASE_URL
+from ClickupTest.clickupAsyncConnect import async_make_request, run_sync
+
+from .clickup import USER, TEAM, list_tasks_url, is_last_page, summarize_task, compact_task, show_folders, show_lists, show_sites, check_task
+from .cache import cached
+
+#
+#
+#
+# Async ClickUp reads
+#
+#
+#
+
+
+async def list_folders_async():
+    """Returns the raw /team/{id}/shared response."""
+    return await async_make_request(f"{CLICKUP_BASE_URL}/team/{TEAM}/shared")
+
+
+async def list_lists_async(folder_id):
+    """Returns the raw /folder/{id}/list response."""
+    return await async_make_request(f"{CLICKUP_BASE_URL}/folder/{folder_id}/list")
+
+
+async def iter_tasks_async(url, prefetch=True):
+    """
+    Async generator over every task of a paged ClickUp task endpoint.
+    The next page is requested as soon as the current one arrives.
+    :raises RuntimeError: If a page could not be fetched.
+    """
+    separator = "&" if "?" in url else "?"
+
+    async def fetch_page(page):
+        response = await async_make_request(f"{url}{separator}page={page}")
+        if response is None or "tasks" not in response:
+            raise RuntimeError(f"Failed to fetch page {page} of {url}")
+        return response
+
+    page = 0
+    response = await fetch_page(page)
+    while True:
+        is_last = is_last_page(response)
+        next_response = None
+        if not is_last and prefetch:
+            next_response = asyncio.ensure_future(fetch_page(page + 1))
+        try:
+            for task in response["tasks"]:
+                yield task
+        except GeneratorExit:
+            if next_response:
+                next_response.cancel()
+            raise
+        if is_last:
+            break
+        page += 1
+        response = await next_response if next_response else await fetch_page(page)
+
+
+async def list_sites_maintenance_async(list_id, assignee_ids=[USER]):
+    """Returns a /list/{id}/task style response holding every page, or None if a page failed."""
+    try:
+        return {"tasks": [task async for task in iter_tasks_async(list_tasks_url(list_id, assignee_ids))]}
+    except RuntimeError:
+        return None
+
+
+async def get_task_async(task_id, quiet=False):
+    """Returns the raw /task/{id} response."""
+    return await async_make_request(f"{CLICKUP_BASE_URL}/task/{task_id}", quiet=quiet)
+
+
+async def fetch_list_tasks_async(list_id, assignee_ids, parse=summarize_task):
+    """
+    Async counterpart of fetch_list_tasks: every page of a list filtered by assignee IDs and statuses.
+    :param parse: Applied to every raw task as its page arrives.
+    :raises RuntimeError: If the tasks could not be fetched.
+    """
+    return [parse(task) async for task in iter_tasks_async(list_tasks_url(list_id, assignee_ids))]
+
+
+async def return_list_sites_async(list_id, assignee_ids):
+    """
+    Fetches tasks from a specific ClickUp list filtered by assignee IDs and statuses.
+    :return: List of dictionaries, each representing a task.
+    """
+    try:
+        return await fetch_list_tasks_async(list_id, assignee_ids)
+    except RuntimeError:
+        return []
+
+
+async def fetch_lists_tasks_async(items, list_id_of, assignee_ids, parse=summarize_task):
+    """Fetches the tasks of every item concurrently. Failures are collected per item instead of cancelling the others."""
+    outcomes = await asyncio.gather(
+        *(fetch_list_tasks_async(list_id_of(item), assignee_ids, parse) for item in items),
+        return_exceptions=True,
+    )
+    results = []
+    errors = []
+    for item, outcome in zip(items, outcomes):
+        if isinstance(outcome, BaseException):
+            results.append(None)
+            errors.append((item, outcome))
+        else:
+            results.append(outcome)
+    return results, errors
+
+
+#
+#
+#
+# Blocking facade (same behaviour as the functions in clickup.py)
+#
+#
+#
+
+
+def list_folders(refresh=False):
+    response = cached("folders", f"{CLICKUP_BASE_URL}/team/{TEAM}/shared", lambda: run_sync(list_folders_async()), refresh)
+    return show_folders(response)
+
+
+def list_lists(folder_id, refresh=False):
+    response = cached("lists", f"{CLICKUP_BASE_URL}/folder/{folder_id}/list", lambda: run_sync(list_lists_async(folder_id)), refresh)
+    return show_lists(response)
+
+
+def list_sites_maintenance(list_id, assignee_ids=[USER], refresh=False):
+    def fetch():
+        response = run_sync(list_sites_maintenance_async(list_id, assignee_ids))
+        return {"tasks": [compact_task(task) for task in response["tasks"]]} if response else None
+
+    try:
+        response = cached("sites", list_tasks_url(list_id, assignee_ids), fetch, refresh)
+    except json.JSONDecodeError:
+        print("Error decoding the CLICKUP_STATUS_FILTER. Please check its format.")
+        return []
+    return show_sites(list_id, response)
+
+
+def get_task(task_id, quiet=False):
+    try:
+        return check_task(task_id, run_sync(get_task_async(task_id, quiet)), quiet)
+    except Exception as e:
+        if not quiet:
+            print(f"An error occurred while fetching task: {e}")
+    return None
+
+
+def return_list_sites(list_id, assignee_ids):
+    return run_sync(return_list_sites_async(list_id, assignee_ids))
+
+
+def fetch_lists_tasks(items, list_id_of, assignee_ids, parse=summarize_task):
+    """
+    Async backend of clickup.fetch_lists_tasks: all lists are requested at once on the shared loop,
+    bounded by the aiohttp connection pool instead of a thread per list.
+    :return: Tuple (task lists in the same order as `items`, None for failures; list of (item, error)).
+    """
+    if not items:
+        return [], []
+    return run_sync(fetch_lists_tasks_async(items, list_id_of, assignee_ids, parse))
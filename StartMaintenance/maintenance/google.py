@@ -1,31 +1,50 @@
 import os
+import threading
+import time
 from dotenv import load_dotenv
 from datetime import datetime
 import json
-import difflib
-from GoogleTest.googleConnect import google_connect, SPREADSHEET_ID, TEMPLATE_SHEET_NAME
+from GoogleTest.googleConnect import (
+    google_connect,
+    find_sheet_properties,
+    invalidate_sheet_properties,
+    ensure_grid_size,
+    text_rule_requests,
+    SPREADSHEET_ID,
+    TEMPLATE_SHEET_NAME,
+)
+
+from .row_diff import diff_rows
+from .cache import set_sheet_synced, is_sheet_synced
 
 load_dotenv()
 
 # Constants
 CLICKUP_STATUS = os.getenv("CLICKUP_STATUS_FILTER")
 
-service = google_connect()
+MAX_BATCH_REQUESTS = 1000  # Requests per spreadsheets.batchUpdate call before a change set is split
+WRITE_DEBOUNCE_SECONDS = float(os.getenv("SHEET_WRITE_DEBOUNCE", "2"))  # 0 writes every update immediately
 
+# Month tab title -> {"columns": header -> column number, "rows": site name -> row number, "width": header length}
+_sheet_index = {}
+_sheet_index_lock = threading.RLock()
+
+# Cell writes waiting for flush_sheet_writes(): A1 range -> value, and (sheetId, row, column) -> colour
+_pending_values = {}
+_pending_colors = {}
+_write_lock = threading.Lock()
+_flush_timer = None
+_flush_deadline = 0.0  # time.monotonic() at which the pending timer should flush, pushed forward by each write
 
-def get_sheet_id_by_name(sheet_name):
-    # Fetch the list of sheets in the spreadsheet
-    sheet_metadata = service.spreadsheets().get(spreadsheetId=SPREADSHEET_ID).execute()
-    sheets = sheet_metadata.get("sheets", "")
 
-    # Search for the sheet ID based on the provided name
-    for sheet in sheets:
-        if sheet["properties"]["title"] == sheet_name:
-            return sheet["properties"]["sheetId"]
-    return None
+def get_sheet_id_by_name(sheet_name):
+    # Tab titles come from the cached spreadsheet metadata, the API is only called again when a title is missing
+    properties = find_sheet_properties(SPREADSHEET_ID, sheet_name)
+    return properties["sheetId"] if properties else None
 
 
 def clone_sheet(title, source_sheet_name):
+    service = google_connect()
     source_sheet_id = get_sheet_id_by_name(source_sheet_name)
     if source_sheet_id is None:
         print(f"No sheet found with the name {source_sheet_name}")
@@ -44,6 +63,7 @@ def clone_sheet(title, source_sheet_name):
     }
     try:
         response = service.spreadsheets().batchUpdate(spreadsheetId=SPREADSHEET_ID, body=body).execute()
+        invalidate_sheet_properties(SPREADSHEET_ID)  # The new tab is not in the cached metadata yet
         new_sheet_id = response["replies"][0]["duplicateSheet"]["properties"]["sheetId"]
         print(f"Cloned sheet with title: {title}, Sheet ID: {new_sheet_id}")
         return new_sheet_id
@@ -57,34 +77,110 @@ def insert_and_fill_row(sheet_id, row_index, new_row_values):
     Inserts a blank row at `row_index` (zero–based) in the sheet with ID sheet_id,
     then writes new_row_values into columns A–D of that row.
     """
-    requests = [
-        # 1) insert a blank row
+    service = google_connect()
+    body = {"requests": insert_rows_requests(sheet_id, row_index, [new_row_values])}
+    service.spreadsheets().batchUpdate(spreadsheetId=SPREADSHEET_ID, body=body).execute()
+
+
+def row_data(rows):
+    """Converts value rows into the RowData list used by updateCells."""
+    return [{"values": [{"userEnteredValue": {"stringValue": str(v)}} for v in row]} for row in rows]
+
+
+def insert_rows_requests(sheet_id, row_index, rows):
+    """Requests that insert `rows` as new rows starting at `row_index` (zero-based)."""
+    return [
+        # 1) insert the blank rows
         {
             "insertDimension": {
-                "range": {"sheetId": sheet_id, "dimension": "ROWS", "startIndex": row_index, "endIndex": row_index + 1},
+                "range": {"sheetId": sheet_id, "dimension": "ROWS", "startIndex": row_index, "endIndex": row_index + len(rows)},
                 "inheritFromBefore": False,
             }
         },
-        # 2) write the A–D values into that new row
-        {
-            "updateCells": {
-                "start": {
-                    "sheetId": sheet_id,
-                    "rowIndex": row_index,
-                    "columnIndex": 0,  # column A
-                },
-                "rows": [{"values": [{"userEnteredValue": {"stringValue": str(v)}} for v in new_row_values]}],
-                "fields": "userEnteredValue",
-            }
-        },
+        # 2) write the A–D values into them
+        update_rows_request(sheet_id, row_index, rows),
     ]
 
-    body = {"requests": requests}
-    service.spreadsheets().batchUpdate(spreadsheetId=SPREADSHEET_ID, body=body).execute()
+
+def update_rows_request(sheet_id, row_index, rows):
+    """Request that overwrites the cells of existing rows starting at `row_index`, column A."""
+    return {
+        "updateCells": {
+            "start": {
+                "sheetId": sheet_id,
+                "rowIndex": row_index,
+                "columnIndex": 0,  # column A
+            },
+            "rows": row_data(rows),
+            "fields": "userEnteredValue",
+        }
+    }
+
+
+def delete_rows_request(sheet_id, row_index, count):
+    return {"deleteDimension": {"range": {"sheetId": sheet_id, "dimension": "ROWS", "startIndex": row_index, "endIndex": row_index + count}}}
+
+
+def compile_diff_requests(sheet_id, operations):
+    """
+    Turns diff_rows() operations into one ordered list of batchUpdate requests.
+    Deletes, moves and inserts act on whole rows, so the columns filled in during maintenance stay with their site.
+    """
+    requests = []
+    for operation in operations:
+        if operation[0] == "update":
+            _, row, column, _, value = operation
+            requests.append(
+                {
+                    "updateCells": {
+                        "start": {"sheetId": sheet_id, "rowIndex": row, "columnIndex": column},
+                        "rows": row_data([[value]]),
+                        "fields": "userEnteredValue",
+                    }
+                }
+            )
+        elif operation[0] == "delete":
+            _, row, removed = operation
+            requests.append(delete_rows_request(sheet_id, row, len(removed)))
+        elif operation[0] == "move":
+            _, source, target, _ = operation
+            requests.append(
+                {
+                    "moveDimension": {
+                        "source": {"sheetId": sheet_id, "dimension": "ROWS", "startIndex": source, "endIndex": source + 1},
+                        # Given in the coordinates from before the row is taken out
+                        "destinationIndex": target + 1 if target > source else target,
+                    }
+                }
+            )
+        else:
+            _, row, added = operation
+            requests.extend(insert_rows_requests(sheet_id, row, added))
+    return requests
+
+
+def send_batch_update(requests):
+    """
+    Sends requests with as few spreadsheets.batchUpdate calls as possible (one, unless the list is
+    larger than MAX_BATCH_REQUESTS). Each call is applied atomically by the API, in order.
+    """
+    service = google_connect()
+    for start in range(0, len(requests), MAX_BATCH_REQUESTS):
+        chunk = requests[start : start + MAX_BATCH_REQUESTS]
+        service.spreadsheets().batchUpdate(spreadsheetId=SPREADSHEET_ID, body={"requests": chunk}).execute()
 
 
 #
-def create_or_update_sheet(data):
+def create_or_update_sheet(data, changed_rows=None):
+    """
+    Creates this month's sheet from `data`, or applies the differences to it if it already exists.
+    The tab is only marked as in sync once a write succeeded, so changes that were declined or failed
+    to apply on an earlier run are diffed again on the next one.
+    :param data: Full sheet rows from google_list_formatter.
+    :param changed_rows: Task rows that changed since the last sync (incremental mode). When empty and the tab
+        is in sync, the tab is neither read nor diffed. None always diffs.
+    """
+    service = google_connect()
     title = datetime.now().strftime("%B %Y")
     sheet_id = get_sheet_id_by_name(title)
 
@@ -95,9 +191,10 @@ def create_or_update_sheet(data):
             print("Failed to create or retrieve the sheet ID.")
             return
         # Since the sheet is new, insert all data directly without checking for changes
-        range_name = f"{title}!A1:D{len(data)}"  # Ensure range covers all necessary columns and rows
+        range_name = f"'{title}'!A1:D{len(data)}"  # Ensure range covers all necessary columns and rows
         body = {"values": data}
         try:
+            ensure_grid_size(SPREADSHEET_ID, title, len(data), len(data[0]))  # The template may have fewer rows than sites
             result = (
                 service.spreadsheets()
                 .values()
@@ -107,13 +204,18 @@ def create_or_update_sheet(data):
             print("New sheet populated with initial data.")
             print("Applying conditional formatting...")
             color_formatting(sheet_id, 3, title)  # Apply formatting
+            set_sheet_synced(title)
         except Exception as e:
             print(f"Failed to populate new sheet: {e}")
     else:
         print(f"Sheet already exists: {title}")
+        if changed_rows is not None and not changed_rows and is_sheet_synced(title):
+            print("No changes detected, no update necessary.")
+            return
+        set_sheet_synced(title, False)  # Until the changes below are confirmed and applied
 
-        # 1) fetch old & new
-        old = service.spreadsheets().values().get(spreadsheetId=SPREADSHEET_ID, range=f"{title}!A1:D1000").execute().get("values", [])
+        # 1) fetch old & new (an open-ended range returns only the populated rows, however many there are)
+        old = service.spreadsheets().values().get(spreadsheetId=SPREADSHEET_ID, range=f"'{title}'!A:D").execute().get("values", [])
         new = data
 
         # pad old rows so trailing blanks don’t trip you up
@@ -121,98 +223,53 @@ def create_or_update_sheet(data):
         old_rows = [r + [""] * (width - len(r)) for r in old]
 
         # 2) compute diffs
-        diffs = compute_row_diffs(old_rows, new)
+        diffs = diff_rows(old_rows, new)
         if not diffs:
+            set_sheet_synced(title)
             print("No changes detected, no update necessary.")
             return
 
-        # split into deletes, inserts, replaces
-        deletes = [d for d in diffs if d[0] == "delete"]
-        inserts = [d for d in diffs if d[0] == "insert"]
-        replaces = [d for d in diffs if d[0] == "replace"]
-
         # 3) summary
         print("Data has changed:")
-        for _, old_slice, pos in deletes:
-            print(f"  → Delete {len(old_slice)} row(s) at {pos + 1}")
-        for _, pos, new_slice in inserts:
-            print(f"  → Insert {len(new_slice)} row(s) at {pos + 1}: {new_slice}")
-        for _, idx, old_row, new_row in replaces:
-            # Only show a replace if it’s really a status/name change,
-            # not a pure shift.
-            if old_row[2] == new_row[2] and old_row[3] != new_row[3]:
-                print(f"  → Replace status in row {idx + 1}: {old_row[3]} → {new_row[3]}")
+        for operation in diffs:
+            if operation[0] == "update":
+                _, row, column, old_value, value = operation
+                header = new[0][column] if column < len(new[0]) else column
+                print(f"  → Replace {header} in row {row + 1} ({old_rows[row][2]}): {old_value} → {value}")
+            elif operation[0] == "delete":
+                _, row, removed = operation
+                print(f"  → Delete {len(removed)} row(s) at {row + 1}: {removed}")
+            elif operation[0] == "move":
+                _, source, target, moved = operation
+                print(f"  → Move row {source + 1} to {target + 1}: {moved}")
+            else:
+                _, row, added = operation
+                print(f"  → Insert {len(added)} row(s) at {row + 1}: {added}")
 
         # 4) confirm
         if input("Apply these changes? (y/n): ").lower() != "y":
             print("No changes applied.")
             return
 
-        # 5a) delete rows first (in reverse order!)
-        for _, old_slice, pos in sorted(deletes, key=lambda d: d[2], reverse=True):
-            count = len(old_slice)
-            service.spreadsheets().batchUpdate(
-                spreadsheetId=SPREADSHEET_ID,
-                body={
-                    "requests": [
-                        {"deleteDimension": {"range": {"sheetId": sheet_id, "dimension": "ROWS", "startIndex": pos, "endIndex": pos + count}}}
-                    ]
-                },
-            ).execute()
-            print(f"Deleted {count} row(s) at {pos + 1}")
-
-        # 5b) insert new rows (in forward order)
-        for _, pos, new_slice in sorted(inserts, key=lambda d: d[1]):
-            for row in new_slice:
-                insert_and_fill_row(sheet_id, pos, row)
-            print(f"Inserted {len(new_slice)} row(s) at {pos + 1}")
-
-        # 5c) patch any real status-changes
-        for _, idx, old_row, new_row in replaces:
-            if old_row[2] == new_row[2] and old_row[3] != new_row[3]:
-                cell = f"{title}!D{idx + 1}"
-                service.spreadsheets().values().update(
-                    spreadsheetId=SPREADSHEET_ID, range=cell, valueInputOption="USER_ENTERED", body={"values": [[new_row[3]]]}
-                ).execute()
-                print(f"Updated status for '{new_row[2]}' in row {idx + 1}")
-
-        # 6) formatting
-        print("All changes have been applied.")
-        print("Applying conditional formatting…")
-        color_formatting(sheet_id, 3, title)
-
+        # 5) deletes, inserts and row patches bottom-up, followed by the formatting, in one batch
+        print("Applying changes and conditional formatting…")
+        requests = compile_diff_requests(sheet_id, diffs)
+        requests.extend(color_formatting_requests(sheet_id, 3, title))
+        try:
+            send_batch_update(requests)
+        except Exception as e:
+            print(f"Failed to apply the changes: {e}")
+            get_sheet_index(title, refresh=True)
+            return
 
-def compute_row_diffs(old_rows, new_rows):
-    """
-    Returns a list of tuples:
-        ('insert',  old_index,  new_rows_slice)
-        ('delete', old_rows_slice, new_index)
-        ('replace', old_index, new_row)
-    """
-    # convert each row-list to a tuple so they become hashable
-    hashable_old = [tuple(r) for r in old_rows]
-    hashable_new = [tuple(r) for r in new_rows]
-    sm = difflib.SequenceMatcher(None, hashable_old, hashable_new)
-    diffs = []
-    for tag, i1, i2, j1, j2 in sm.get_opcodes():
-        if tag == "insert":
-            # new_rows[j1:j2] were inserted at position i1
-            diffs.append(("insert", i1, new_rows[j1:j2]))
-        elif tag == "delete":
-            # old_rows[i1:i2] were deleted
-            diffs.append(("delete", old_rows[i1:i2], i1))
-        elif tag == "replace":
-            # rows i1..i2 replaced by j1..j2
-            # we’ll treat each replaced row as a separate diff
-            length = max(i2 - i1, j2 - j1)
-            for k in range(length):
-                old = old_rows[i1 + k] if i1 + k < i2 else None
-                new = new_rows[j1 + k] if j1 + k < j2 else None
-                diffs.append(("replace", i1 + k, old, new))
-    return diffs
+        # The tab now holds `new`, so move the row index along without reading it back
+        index_rows(title, new)
+        set_sheet_synced(title)
+        print("All changes have been applied.")
 
 
 def check_for_data_update(sheet_id, range_name, new_data):
+    service = google_connect()
     try:
         result = service.spreadsheets().values().get(spreadsheetId=SPREADSHEET_ID, range=range_name).execute()
         existing_data = result.get("values", [])
@@ -242,12 +299,20 @@ def hex_to_rgb_norm(hex_color):
 
 
 def color_formatting(sheet_id, status_column_index, sheet_title):
+    requests = color_formatting_requests(sheet_id, status_column_index, sheet_title)
+    if requests:
+        # Send batchUpdate to apply all formatting rules
+        send_batch_update(requests)
+
+
+def color_formatting_requests(sheet_id, status_column_index, sheet_title):
+    """Conditional formatting requests colouring the status column by status."""
     # Assuming `CLICKUP_STATUS` contains a JSON string of statuses
     try:
         status_list = json.loads(CLICKUP_STATUS)
     except json.JSONDecodeError:
         print("Failed to decode CLICKUP_STATUS_FILTER. Please check its format.")
-        return
+        return []
 
     # Defining colors for each status
     PURPLE = hex_to_rgb_norm("#cb8ccb")
@@ -261,35 +326,14 @@ def color_formatting(sheet_id, status_column_index, sheet_title):
         status_list[2]: YELLOW,  # Yellow
     }
 
-    requests = []
-    for status, color in status_colors.items():
-        requests.append(
-            {
-                "addConditionalFormatRule": {
-                    "rule": {
-                        "ranges": [
-                            {
-                                "sheetId": sheet_id,
-                                "startRowIndex": 1,  # Assuming headers are in the first row
-                                "endRowIndex": 1000,  # Adjust as necessary
-                                "startColumnIndex": status_column_index,
-                                "endColumnIndex": status_column_index + 1,
-                            }
-                        ],
-                        "booleanRule": {
-                            "condition": {"type": "TEXT_EQ", "values": [{"userEnteredValue": status}]},
-                            "format": {"backgroundColor": color},
-                        },
-                    },
-                    "index": 0,  # Rule priority order
-                }
-            }
-        )
-
-    # Send batchUpdate to apply all formatting rules
-    body = {"requests": requests}
-    response = service.spreadsheets().batchUpdate(spreadsheetId=SPREADSHEET_ID, body=body).execute()
-    # print(f"Conditional formatting applied: {response}")
+    # Only the rules that are missing or out of date are sent, so re-running never piles up duplicates
+    status_range = {
+        "sheetId": sheet_id,
+        "startRowIndex": 1,  # Assuming headers are in the first row; no endRowIndex, so it covers every row the tab grows to
+        "startColumnIndex": status_column_index,
+        "endColumnIndex": status_column_index + 1,
+    }
+    return text_rule_requests(SPREADSHEET_ID, sheet_id, status_range, status_colors)
 
 
 def google_list_formatter(raw_data):
@@ -330,8 +374,14 @@ def google_list_formatter(raw_data):
 #
 
 
-def update_google_sheet(site_name, data, column_name):
-    service = google_connect()
+def update_google_sheet(site_name, data, column_name, show=True, debounce=True):
+    """
+    Sets the `column_name` cell of `site_name` on this month's tab and colours it.
+    The write is queued and sent with the next flush_sheet_writes().
+    :param show: Print the change (bulk syncs turn this off).
+    :param debounce: Flush automatically after WRITE_DEBOUNCE_SECONDS of quiet. Callers that flush
+        explicitly when they are done (bulk syncs) turn this off.
+    """
     title = datetime.now().strftime("%B %Y")
     sheet_id = get_sheet_id_by_name(title)
 
@@ -339,32 +389,23 @@ def update_google_sheet(site_name, data, column_name):
         print(f"No sheet found for {title}. Please check the sheet name.")
         return
 
-    range_name = f"{title}!A1:Z1000"
     try:
-        result = service.spreadsheets().values().get(spreadsheetId=SPREADSHEET_ID, range=range_name).execute()
-        values = result.get("values", [])
+        index = get_sheet_index(title)
 
-        if not values:
+        if not index["columns"]:
             print("The sheet is empty or the range is incorrect.")
             return
 
-        if len(values[0]) < 3:
+        if index["width"] < 3:
             print("Header does not contain enough columns.")
             return
 
-        header = values[0]
-        try:
-            column_index = header.index(column_name) + 1
-        except ValueError:
+        column_index = index["columns"].get(column_name)
+        if column_index is None:
             print(f"Column {column_name} not found.")
             return
 
-        row_number = None
-        for i, row in enumerate(values, start=1):
-            if len(row) > 2 and row[2].strip().lower() == site_name.strip().lower():
-                row_number = i
-                break
-
+        row_number = find_site_row(title, site_name)
         if row_number is None:
             print(f"Site name '{site_name}' not found in the sheet.")
             return
@@ -373,19 +414,175 @@ def update_google_sheet(site_name, data, column_name):
             data = "Incomplete"
 
         cell_address = f"{get_column_letter(column_index)}{row_number}"
-        body = {"values": [[data]], "range": f"{title}!{cell_address}", "majorDimension": "ROWS"}
-        service.spreadsheets().values().update(
-            spreadsheetId=SPREADSHEET_ID, range=f"{title}!{cell_address}", valueInputOption="USER_ENTERED", body=body
-        ).execute()
-
         # Apply color formatting based on the data
         color = determine_background_color(data, column_name)
-        apply_background_color(SPREADSHEET_ID, cell_address, color)
+        queue_cell_write(f"'{title}'!{cell_address}", data, sheet_id, row_number - 1, column_index - 1, color, debounce)
+        if show:
+            print(f"Sheet: {column_name} → {data}")
 
     except Exception as e:
         print(f"An error occurred: {e}")
 
 
+def queue_cell_write(cell_range, value, sheet_id, row_index, column_index, color, debounce=True):
+    """
+    Queues a value and background colour for one cell. A later write to the same cell replaces it.
+    Queued writes are sent after WRITE_DEBOUNCE_SECONDS of quiet, or at the next explicit flush.
+    :param debounce: Schedule the automatic flush. Without it the write waits for an explicit flush_sheet_writes().
+    """
+    global _flush_deadline
+    with _write_lock:
+        _pending_values[cell_range] = value
+        _pending_colors[(sheet_id, row_index, column_index)] = color
+        if debounce and WRITE_DEBOUNCE_SECONDS > 0:
+            # One timer at a time: a write only moves the deadline, the timer re-arms itself if it fires early
+            _flush_deadline = time.monotonic() + WRITE_DEBOUNCE_SECONDS
+            if _flush_timer is None:
+                start_flush_timer(WRITE_DEBOUNCE_SECONDS)
+    if debounce and WRITE_DEBOUNCE_SECONDS <= 0:
+        flush_sheet_writes()
+
+
+def start_flush_timer(seconds):
+    """Starts the debounce timer. Must be called with _write_lock held."""
+    global _flush_timer
+    _flush_timer = threading.Timer(seconds, flush_when_quiet)
+    _flush_timer.daemon = True
+    _flush_timer.start()
+
+
+def flush_when_quiet():
+    """Debounce timer callback: flushes once the deadline has passed, otherwise waits for the rest of it."""
+    global _flush_timer
+    with _write_lock:
+        if _flush_timer is None or _flush_timer is not threading.current_thread():
+            return  # Cancelled by an explicit flush in the meantime
+        remaining = _flush_deadline - time.monotonic()
+        if remaining > 0:
+            start_flush_timer(remaining)
+            return
+        _flush_timer = None
+    flush_sheet_writes()
+
+
+def flush_sheet_writes():
+    """Sends every queued cell write as one values.batchUpdate plus one spreadsheets.batchUpdate."""
+    global _flush_timer, _pending_values, _pending_colors
+    with _write_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        values, colors = _pending_values, _pending_colors
+        _pending_values, _pending_colors = {}, {}
+
+    # Sites missing from the index may be looked up with a fresh read again after each flush
+    with _sheet_index_lock:
+        for index in _sheet_index.values():
+            index["refreshed"] = False
+
+    if not values and not colors:
+        return
+
+    service = google_connect()
+    try:
+        if values:
+            body = {"valueInputOption": "USER_ENTERED", "data": [{"range": cell_range, "values": [[value]]} for cell_range, value in values.items()]}
+            service.spreadsheets().values().batchUpdate(spreadsheetId=SPREADSHEET_ID, body=body).execute()
+            values = {}
+        if colors:
+            requests = [
+                {
+                    "repeatCell": {
+                        "range": {
+                            "sheetId": sheet_id,
+                            "startRowIndex": row_index,
+                            "endRowIndex": row_index + 1,
+                            "startColumnIndex": column_index,
+                            "endColumnIndex": column_index + 1,
+                        },
+                        "cell": {"userEnteredFormat": {"backgroundColor": color}},
+                        "fields": "userEnteredFormat.backgroundColor",
+                    }
+                }
+                for (sheet_id, row_index, column_index), color in colors.items()
+            ]
+            service.spreadsheets().batchUpdate(spreadsheetId=SPREADSHEET_ID, body={"requests": requests}).execute()
+    except Exception as e:
+        print(f"Failed to write queued Google Sheet updates, they will be retried on the next flush: {e}")
+        # Put back whatever was not sent, without overriding anything queued in the meantime
+        with _write_lock:
+            for cell_range, value in values.items():
+                _pending_values.setdefault(cell_range, value)
+            for cell, color in colors.items():
+                _pending_colors.setdefault(cell, color)
+
+
+def normalize_site_name(site_name):
+    return site_name.strip().lower()
+
+
+def find_site_row(title, site_name):
+    """
+    Returns the 1-based row of a site on a month tab, or None.
+    The tab may have been edited outside this session, so a miss re-reads it, but at most once per flush;
+    sites still missing after that are remembered and not looked up again until the next re-read.
+    """
+    name = normalize_site_name(site_name)
+    with _sheet_index_lock:
+        index = get_sheet_index(title)
+        row_number = index["rows"].get(name)
+        if row_number is not None or name in index["misses"]:
+            return row_number
+        if not index["refreshed"]:
+            index = get_sheet_index(title, refresh=True)
+            row_number = index["rows"].get(name)
+        if row_number is None:
+            index["misses"].add(name)
+        return row_number
+
+
+def get_sheet_index(title, refresh=False):
+    """
+    Returns the header -> column and site name -> row index of a month tab (both 1-based).
+    Built once from a narrow read of the header row and column C, then kept up to date in place.
+    """
+    with _sheet_index_lock:
+        if refresh or title not in _sheet_index:
+            service = google_connect()
+            result = (
+                service.spreadsheets()
+                .values()
+                .batchGet(spreadsheetId=SPREADSHEET_ID, ranges=[f"'{title}'!1:1", f"'{title}'!C:C"])
+                .execute()
+            )
+            header_range, site_range = result.get("valueRanges", [{}, {}])
+            header = (header_range.get("values") or [[]])[0]
+            columns = {}
+            for column_number, column_name in enumerate(header, start=1):
+                columns.setdefault(column_name, column_number)  # First match wins, like header.index()
+            # refreshed: the tab was read since the last flush; misses: sites known to be absent from that read
+            _sheet_index[title] = {"columns": columns, "rows": {}, "width": len(header), "refreshed": True, "misses": set()}
+            index_rows(title, site_range.get("values", []), column=0)
+        return _sheet_index[title]
+
+
+def index_rows(title, rows, column=2):
+    """
+    Replaces the site name -> row part of a tab's index with `rows` (what the tab now holds).
+    Does nothing if the tab was never indexed; the index is then built on first use.
+    :param column: Position of the site name inside each row.
+    """
+    with _sheet_index_lock:
+        if title not in _sheet_index:
+            return
+        site_rows = {}
+        for row_number, row in enumerate(rows, start=1):
+            if len(row) > column and row[column].strip():
+                site_rows.setdefault(normalize_site_name(row[column]), row_number)
+        _sheet_index[title]["rows"] = site_rows
+        _sheet_index[title]["misses"] = set()
+
+
 def get_column_letter(column_index):
     """Converts an index to a column letter (e.g., 1 -> 'A', 2 -> 'B', ... 27 -> 'AA')."""
     result = ""
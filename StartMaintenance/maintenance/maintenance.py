@@ -1,3 +1,4 @@
+import os
 from StartMaintenance.maintenance.clickup import (
     list_folders,
     list_lists,
@@ -18,15 +19,43 @@ from StartMaintenance.maintenance.clickup import (
     get_custom_field_value,
     select_file_gui,
     upload_file_to_clickup,
+    warm_task_checks,
+    UNCHANGED,
 )
+from StartMaintenance.maintenance.google import flush_sheet_writes
+from StartMaintenance.maintenance.prefetch import prefetch_sites, take_prefetched, clear_prefetch
+
+if os.getenv("CLICKUP_BACKEND", "sync").lower() == "async":
+    # Reads go through the asyncio client; writes stay on the pooled requests session
+    from StartMaintenance.maintenance.clickup_async import list_folders, list_lists, list_sites_maintenance, get_task
+
+
+def apply_update(task, field_name, result):
+    """
+    Patches the result of an update action into the local task.
+    :param result: The value written to `field_name`, UNCHANGED if nothing was written, or None if the write failed.
+    :return: The task to show next, or None to fetch it again from ClickUp.
+    """
+    if result is UNCHANGED:
+        return task
+    if result is None:
+        return None  # The write failed (or its result is only known to ClickUp): fetch the real state
+    if field_name == "status":
+        task.status = result
+    else:
+        task.set_value(field_name, result)
+    return task
 
 
 def maintenance():
+    refresh = False
     while True:
         # === FOLDER MENU ===
         print("\n📁 FOLDER MENU:")
+        print("Type 'r' to refresh folders.")
         print("Type 'exit' to return to Main Menu.")
-        folders = list_folders()
+        folders = list_folders(refresh=refresh)
+        refresh = False
         if not folders:
             print("No Folders")
             return
@@ -34,6 +63,9 @@ def maintenance():
         folder_input = input("Choose a folder number: ").strip()
         if folder_input.lower() == "exit":
             break
+        if folder_input.lower() == "r":
+            refresh = True
+            continue
         if not folder_input.isdigit() or int(folder_input) not in range(1, len(folders) + 1):
             print("Invalid folder selection.")
             continue
@@ -45,9 +77,10 @@ def maintenance():
             # === LIST MENU ===
             print("\n📋 LIST MENU:")
             print("Type '.' to go back to Folder Menu.")
-            print("Type 'r' to refresh folders.")
+            print("Type 'r' to refresh lists.")
             print("Type 'exit' to return to Main Menu.")
-            lists = list_lists(folder_id)
+            lists = list_lists(folder_id, refresh=refresh)
+            refresh = False
             if not lists:
                 print("No Lists")
                 break
@@ -55,7 +88,8 @@ def maintenance():
             list_input = input("Choose a list number: ").strip()
             if list_input == ".":
                 break
-            if folder_input == "refresh":
+            if list_input.lower() == "r":
+                refresh = True
                 continue
             if list_input.lower() == "exit":
                 return
@@ -70,20 +104,26 @@ def maintenance():
                 # === SITE MENU ===
                 print("\n🌐 SITE MENU:")
                 print("Type '.' to go back to List Menu.")
-                print("Type 'r' to refresh List Menu.")
+                print("Type 'r' to refresh sites.")
                 print("Type 'exit' to return to Main Menu.")
-                sites = list_sites_maintenance(list_id)
+                sites = list_sites_maintenance(list_id, refresh=refresh)
+                refresh = False
                 if not sites:
                     print("No Sites")
                     print(sites)
+                    clear_prefetch()
                     break
 
                 site_input = input("Choose a site number: ").strip()
                 if site_input == ".":
+                    clear_prefetch()  # Leaving the list, its prefetched sites are no longer needed
                     break
-                if folder_input == "refresh":
+                if site_input.lower() == "r":
+                    clear_prefetch()
+                    refresh = True
                     continue
                 if site_input.lower() == "exit":
+                    clear_prefetch()
                     return
                 if not site_input.isdigit() or int(site_input) not in range(1, len(sites) + 1):
                     print("Invalid site selection.")
@@ -93,12 +133,19 @@ def maintenance():
                 site_name = selected_site["name"]
                 site_id = selected_site["id"]
 
+                # Use the task if it was loaded ahead, and start loading the sites that follow it
+                task = take_prefetched(site_id)
+                prefetch_sites(sites[int(site_input) :], get_task, warm_task_checks)
                 while True:
                     # === UPDATE MENU ===
-                    task = get_task(site_id)
+                    if task is None:
+                        task = get_task(site_id)  # Only on entry, on 'r', or after a failed write
+                        if task is None:
+                            print("Could not load this site.")
+                            break
                     # Uncomment to see data coming in
-                    # print(task["custom_fields"])
-                    task_id = task["id"]
+                    # print(task.fields)
+                    task_id = task.id
                     print("\n🛠️ UPDATE MENU for " + site_name + ":")
 
                     display_task_details(task)
@@ -106,34 +153,39 @@ def maintenance():
                     print("0. Change Clickup Status")
                     print("==================================")
                     print("Type '.' to go back to Site Menu.")
-                    print("Type 'r' to refresh Site Menu.")
+                    print("Type 'r' to refresh this site.")
                     print("Type 'exit' to return to Main Menu.")
                     print("==================================")
 
                     update_input = input("Enter your choice: ").strip()
 
                     if update_input == ".":
+                        flush_sheet_writes()  # Send this site's queued sheet changes
                         break
-                    if folder_input == "refresh":
+                    if update_input.lower() == "r":
+                        task = None  # Fetched again at the top of the loop
                         continue
                     if update_input.lower() == "exit":
+                        flush_sheet_writes()
+                        clear_prefetch()
                         return
 
                     if update_input == "1":
                         field_id = get_field_id_by_name(task, "Broken Links Report")
                         file_path = select_file_gui()
                         if file_path:
-                            upload_file_to_clickup(task_id, field_id, file_path)
+                            task = apply_update(task, "Broken Links Report", upload_file_to_clickup(task_id, field_id, file_path))
                         else:
                             print("No file selected.")
 
                     elif update_input == "2":
                         field_id = get_field_id_by_name(task, "Date Completed")
-                        date_completed(task_id, field_id)
+                        task = apply_update(task, "Date Completed", date_completed(task_id, field_id))
 
                     elif update_input == "3":
                         field_id = get_field_id_by_name(task, "Date for Email Subject Line (Month & Year)")
-                        date_email_subject_line(task_id, field_id)
+                        result = date_email_subject_line(task_id, field_id)
+                        task = apply_update(task, "Date for Email Subject Line (Month & Year)", result)
 
                     elif update_input == "4":
                         print("website_url: not built")
@@ -141,30 +193,30 @@ def maintenance():
 
                     elif update_input == "5":
                         field_id = get_field_id_by_name(task, "WordPress Version")
-                        wordpress_version(task_id, field_id)
+                        task = apply_update(task, "WordPress Version", wordpress_version(task_id, field_id))
 
                     elif update_input == "6":
                         text = get_custom_field_value(task, "Notes for Maintenance Report")
                         field_id = get_field_id_by_name(task, "Notes for Maintenance Report")
-                        maintenance_notes(site_name, task_id, field_id, text)
+                        task = apply_update(task, "Notes for Maintenance Report", maintenance_notes(site_name, task_id, field_id, text))
 
                     elif update_input == "6.1":
                         text = get_custom_field_value(task, "Notes for Maintenance Report")
                         field_id = get_field_id_by_name(task, "Notes for Maintenance Report")
-                        update_footer(site_name, task_id, field_id, text)
+                        task = apply_update(task, "Notes for Maintenance Report", update_footer(site_name, task_id, field_id, text))
 
                     elif update_input == "6.2":
                         text = get_custom_field_value(task, "Notes for Maintenance Report")
                         field_id = get_field_id_by_name(task, "Notes for Maintenance Report")
-                        update_slider(site_name, task_id, field_id, text)
+                        task = apply_update(task, "Notes for Maintenance Report", update_slider(site_name, task_id, field_id, text))
 
                     elif update_input == "7":
                         field_id = get_field_id_by_name(task, "Number of Plugins Updated")
-                        update_plugins(site_name, task_id, field_id)
+                        task = apply_update(task, "Number of Plugins Updated", update_plugins(site_name, task_id, field_id))
 
                     elif update_input == "8":
                         field_id = get_field_id_by_name(task, "Domain Expiration")
-                        domain_exp(site_name, task, task_id, field_id)
+                        task = apply_update(task, "Domain Expiration", domain_exp(site_name, task, task_id, field_id))
 
                     elif update_input == "9":
                         print("Syncing status to Google Sheets...")
@@ -172,7 +224,7 @@ def maintenance():
                         print("Sync completed!")
 
                     elif update_input == "0":
-                        change_clickup_status(site_name, task_id)
+                        task = apply_update(task, "status", change_clickup_status(site_name, task_id))
 
                     else:
                         print("Invalid choice.")
@@ -0,0 +1,86 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Constants
+PREFETCH_AHEAD = int(os.getenv("PREFETCH_AHEAD", "2"))  # Sites after the open one to load in the background (0 = off)
+PREFETCH_CACHE_SIZE = max(int(os.getenv("PREFETCH_CACHE_SIZE", "8")), PREFETCH_AHEAD)
+PREFETCH_TTL_SECONDS = float(os.getenv("PREFETCH_TTL_SECONDS", "120"))  # Older prefetched tasks are fetched again when opened
+
+_executor = None
+_prefetched = OrderedDict()  # site id -> (Task, time.monotonic() it was fetched at), least recently stored first
+_pending = set()
+_generation = 0  # Bumped by clear_prefetch() so loads still running for an old list are thrown away
+_lock = threading.Lock()
+
+
+def prefetch_sites(sites, fetch_task, warm_checks):
+    """
+    Loads the next sites of the walk-through in the background, one at a time, while the technician works:
+    the task itself and the slow checks shown in its update menu (which land in their own caches).
+    :param sites: The upcoming sites of the list, in order (dicts with an "id").
+    :param fetch_task: get_task of the backend in use, called with quiet=True so failures stay off the technician's prompt.
+    :param warm_checks: Called with each loaded task to pre-evaluate its expensive fields.
+    """
+    global _executor
+    with _lock:
+        if _executor is None:
+            # A single worker keeps prefetching from competing with the technician's own requests
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        generation = _generation
+        for site in sites[:PREFETCH_AHEAD]:
+            entry = _prefetched.get(site["id"])
+            if site["id"] in _pending or (entry and time.monotonic() - entry[1] <= PREFETCH_TTL_SECONDS):
+                continue  # Loading, or loaded recently enough; an expired copy is loaded again
+            _pending.add(site["id"])
+            _executor.submit(load_site, site["id"], generation, fetch_task, warm_checks)
+
+
+def load_site(site_id, generation, fetch_task, warm_checks):
+    try:
+        with _lock:
+            if generation != _generation:
+                return
+        fetched_at = time.monotonic()
+        task = fetch_task(site_id, quiet=True)
+        if task is None:
+            return
+        warm_checks(task)
+        with _lock:
+            if generation != _generation:
+                return
+            _prefetched[site_id] = (task, fetched_at)
+            _prefetched.move_to_end(site_id)
+            while len(_prefetched) > PREFETCH_CACHE_SIZE:
+                _prefetched.popitem(last=False)
+    except Exception as e:
+        pass  # A failed prefetch just means the site is fetched when it is opened
+    finally:
+        with _lock:
+            _pending.discard(site_id)
+
+
+def take_prefetched(site_id):
+    """
+    Returns (and forgets) the prefetched task of a site, or None if it was not loaded ahead
+    or was loaded more than PREFETCH_TTL_SECONDS ago (it is not refetched once the site is open).
+    """
+    with _lock:
+        task, fetched_at = _prefetched.pop(site_id, (None, None))
+    if task is None or time.monotonic() - fetched_at > PREFETCH_TTL_SECONDS:
+        return None
+    return task
+
+
+def clear_prefetch():
+    """Drops every prefetched task and abandons queued loads, called when leaving a list."""
+    global _generation
+    with _lock:
+        _generation += 1
+        _prefetched.clear()
+        _pending.clear()
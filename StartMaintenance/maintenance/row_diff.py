@@ -0,0 +1,140 @@
+from bisect import bisect_left
+
+# Columns that identify a row of the month tab: Folder, List, Task Name. The rest (Status) are values.
+KEY_COLUMNS = 3
+
+
+def row_keys(rows, key_columns=KEY_COLUMNS):
+    """
+    Returns one hashable key per row. Rows sharing the same key columns are told apart by
+    their occurrence number, so duplicate task names still pair up first-with-first.
+    """
+    seen = {}
+    keys = []
+    for row in rows:
+        key = tuple(row[:key_columns])
+        occurrence = seen.get(key, 0)
+        seen[key] = occurrence + 1
+        keys.append(key + (occurrence,))
+    return keys
+
+
+def longest_increasing_subsequence(sequence):
+    """Returns the positions in `sequence` of one longest strictly increasing subsequence (O(n log n))."""
+    tails = []  # tails[k] = position of the smallest tail of an increasing run of length k + 1
+    tail_values = []
+    previous = [-1] * len(sequence)
+    for i, value in enumerate(sequence):
+        k = bisect_left(tail_values, value)
+        if k:
+            previous[i] = tails[k - 1]
+        if k == len(tails):
+            tails.append(i)
+            tail_values.append(value)
+        else:
+            tails[k] = i
+            tail_values[k] = value
+
+    positions = []
+    i = tails[-1] if tails else -1
+    while i != -1:
+        positions.append(i)
+        i = previous[i]
+    positions.reverse()
+    return positions
+
+
+def diff_rows(old_rows, new_rows, key_columns=KEY_COLUMNS):
+    """
+    Computes the operations that turn `old_rows` into `new_rows`, pairing rows by their key columns.
+    Rows are hash-joined on their key and the longest increasing subsequence of the kept rows stays in place,
+    so everything runs in O(n log n) apart from moves, which are rare on a sorted sheet.
+
+    Operations are returned in the order they must be applied, with row indices as they stand at that moment:
+        ('update', row, column, old_value, new_value)  # positions in the old sheet, applied first
+        ('delete', row, old_rows_slice)                 # bottom-up, so earlier deletes never shift later ones
+        ('move',   from_row, to_row, row)               # to_row is the row's index once it has moved
+        ('insert', row, new_rows_slice)                 # top-down, at the row's final position
+
+    :param old_rows: Rows currently on the sheet, padded to the width of `new_rows`.
+    :param new_rows: Rows the sheet should hold.
+    """
+    old_keys = row_keys(old_rows, key_columns)
+    new_keys = row_keys(new_rows, key_columns)
+    old_index = {key: i for i, key in enumerate(old_keys)}
+    new_index = {key: j for j, key in enumerate(new_keys)}
+
+    operations = []
+
+    # 1) Cell updates on rows present in both, addressed by their old position
+    matched = []  # (new position, old position) of kept rows, in new order
+    for j, key in enumerate(new_keys):
+        i = old_index.get(key)
+        if i is None:
+            continue
+        matched.append((j, i))
+        old_row, new_row = old_rows[i], new_rows[j]
+        for column in range(key_columns, max(len(old_row), len(new_row))):
+            old_value = old_row[column] if column < len(old_row) else ""
+            new_value = new_row[column] if column < len(new_row) else ""
+            if old_value != new_value:
+                operations.append(("update", i, column, old_value, new_value))
+
+    # 2) Deletes, grouped into runs and applied from the bottom up
+    deleted = [i for i, key in enumerate(old_keys) if key not in new_index]
+    runs = []
+    for i in deleted:
+        if runs and runs[-1][1] == i:
+            runs[-1][1] = i + 1
+        else:
+            runs.append([i, i + 1])
+    for start, end in reversed(runs):
+        operations.append(("delete", start, old_rows[start:end]))
+
+    # 3) Moves: the kept rows outside the longest increasing run of old positions change place
+    stays = set(longest_increasing_subsequence([i for _, i in matched]))
+    if len(stays) < len(matched):
+        current = sorted(old_index[new_keys[j]] for j, _ in matched)  # Kept rows in sheet order, by old position
+        for n, (j, i) in enumerate(matched):
+            if n in stays:
+                continue
+            source = current.index(i)
+            current.pop(source)
+            target = current.index(matched[n - 1][1]) + 1 if n else 0
+            current.insert(target, i)
+            if source != target:
+                operations.append(("move", source, target, new_rows[j]))
+
+    # 4) Inserts, grouped into runs and applied top-down at their final position
+    runs = []
+    for j, key in enumerate(new_keys):
+        if key in old_index:
+            continue
+        if runs and runs[-1][1] == j:
+            runs[-1][1] = j + 1
+        else:
+            runs.append([j, j + 1])
+    for start, end in runs:
+        operations.append(("insert", start, new_rows[start:end]))
+
+    return operations
+
+
+def apply_row_diff(rows, operations):
+    """Applies diff_rows() operations to a list of rows in memory, the same way the sheet applies them."""
+    rows = [list(row) for row in rows]
+    for operation in operations:
+        if operation[0] == "update":
+            _, i, column, _, value = operation
+            rows[i] += [""] * (column + 1 - len(rows[i]))
+            rows[i][column] = value
+        elif operation[0] == "delete":
+            _, i, removed = operation
+            del rows[i : i + len(removed)]
+        elif operation[0] == "move":
+            _, source, target, _ = operation
+            rows.insert(target, rows.pop(source))
+        else:
+            _, i, added = operation
+            rows[i:i] = [list(row) for row in added]
+    return rows
@@ -0,0 +1,85 @@
+import re
+from collections import namedtuple
+from datetime import datetime
+
+# Marks a custom field that exists on the task but has never been given a value
+UNSET = object()
+
+# The parts of a ClickUp custom field the maintenance tools use
+Field = namedtuple("Field", ["id", "type", "value"])
+
+
+def normalize_domain(url):
+    """Turns a Website URL value into the bare domain used for WHOIS ("https://www.Site.com/a" -> "site.com")."""
+    if not url:
+        return None
+    domain = re.sub(r"^[a-z]+://", "", str(url).strip().lower()).split("/")[0].split(":")[0]
+    if domain.startswith("www."):
+        domain = domain[4:]
+    return domain or None
+
+
+class Task:
+    """
+    A ClickUp task parsed once from its API response.
+    Custom fields are indexed by name, so every lookup is a dict access instead of a scan of `custom_fields`,
+    and only the fields the tools read are kept from the raw JSON.
+    """
+
+    __slots__ = ("id", "name", "status", "list_id", "fields", "_domain")
+
+    def __init__(self, raw):
+        self.id = raw["id"]
+        self.name = raw.get("name")
+        self.status = (raw.get("status") or {}).get("status", "No status found")
+        self.list_id = (raw.get("list") or {}).get("id")
+        self.fields = {}
+        for field in raw.get("custom_fields", []):
+            # First field of a name wins, like the scans this replaces
+            self.fields.setdefault(field.get("name"), Field(field.get("id"), field.get("type"), field.get("value", UNSET)))
+        self._domain = UNSET
+
+    def __repr__(self):
+        return f"Task({self.id!r}, {self.name!r}, {self.status!r})"
+
+    def field(self, name):
+        """Returns the Field called `name`, or None if the task does not have it."""
+        return self.fields.get(name)
+
+    def field_id(self, name):
+        field = self.fields.get(name)
+        return field.id if field else None
+
+    def value(self, name, default=None):
+        """Raw value of a custom field, or `default` if the field is missing or empty."""
+        field = self.fields.get(name)
+        return default if field is None or field.value is UNSET or field.value is None else field.value
+
+    def string(self, name, default=""):
+        value = self.value(name)
+        return default if value is None else str(value)
+
+    def date(self, name):
+        """A date field (ClickUp stores milliseconds since the epoch) as a datetime, or None."""
+        try:
+            return datetime.fromtimestamp(int(self.value(name)) / 1000)
+        except (TypeError, ValueError):
+            return None
+
+    def attachments(self, name):
+        """The attachments of a file field, most recent first, or an empty list."""
+        return self.value(name) or []
+
+    def set_value(self, name, value):
+        """Patches a custom field after a successful write, so the task need not be fetched again."""
+        field = self.fields.get(name)
+        self.fields[name] = field._replace(value=value) if field else Field(None, None, value)
+        if name == "Website URL":
+            self._domain = UNSET
+
+    @property
+    def domain(self):
+        """Normalized domain of the Website URL field (memoized), or None."""
+        if self._domain is UNSET:
+            self._domain = normalize_domain(self.value("Website URL"))
+        return self._domain
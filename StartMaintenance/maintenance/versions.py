@@ -0,0 +1,106 @@
+import os
+import threading
+import time
+from dotenv import load_dotenv
+
+from .cache import CACHE_TTL, cache_get, cache_get_entry, cache_put
+
+load_dotenv()
+
+# Constants
+VERSION_CHECK_TIMEOUT = float(os.getenv("VERSION_CHECK_TIMEOUT", "5"))  # Seconds before a wordpress.org request gives up
+WORDPRESS_CORE_URL = "https://api.wordpress.org/core/version-check/1.7/"
+WORDPRESS_PLUGIN_URL = "https://api.wordpress.org/plugins/info/1.2/?action=plugin_information&request[slug]={slug}"
+
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+
+#
+#
+#
+# Upstream version feeds
+#
+#
+#
+
+
+def feed_for(name):
+    """
+    Returns (url, parse) for a feed name: "wordpress" for core, "plugin:<slug>" for a plugin of the wordpress.org directory.
+    `parse` turns the JSON response into the latest version string.
+    """
+    if name == "wordpress":
+        return WORDPRESS_CORE_URL, lambda data: data["offers"][0]["current"]
+    if name.startswith("plugin:"):
+        return WORDPRESS_PLUGIN_URL.format(slug=name.split(":", 1)[1]), lambda data: data["version"]
+    raise ValueError(f"Unknown version feed: {name}")
+
+
+def revalidate(name):
+    """
+    Fetches a feed, sending the stored ETag/Last-Modified so an unchanged feed costs a bodyless 304.
+    Failures are remembered for CACHE_TTL_VERSIONS_MISS seconds and leave the stored version in place.
+    :return: The latest version, or None if the feed could not be read.
+    """
+    import requests  # Only needed for the version check, imported on first use
+
+    url, parse = feed_for(name)
+    entry, _ = cache_get_entry("versions", name)
+    headers = {}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+
+    try:
+        response = requests.get(url, headers=headers, timeout=VERSION_CHECK_TIMEOUT)
+        if response.status_code == 304 and entry:
+            cache_put("versions", name, entry)  # Still current, restart its TTL
+            return entry["version"]
+        response.raise_for_status()
+        entry = {
+            "version": parse(response.json()),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        cache_put("versions", name, entry)
+        return entry["version"]
+    except Exception as e:
+        cache_put("versions_miss", name, {})
+        return None
+
+
+def revalidate_in_background(name):
+    """Starts revalidate(name) on a daemon thread unless one is already running for that feed."""
+    with _refreshing_lock:
+        if name in _refreshing:
+            return
+        _refreshing.add(name)
+
+    def run():
+        try:
+            revalidate(name)
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(name)
+
+    threading.Thread(target=run, name=f"revalidate-{name}", daemon=True).start()
+
+
+def get_latest_version(name):
+    """
+    Returns the latest upstream version of a feed (see feed_for), stale-while-revalidate:
+    a fresh value is returned as is, a stale one is returned immediately while a background refresh runs.
+    Only the very first lookup of a feed waits on the network, for at most VERSION_CHECK_TIMEOUT seconds.
+    :return: Version string, or None if it has never been fetched successfully.
+    """
+    entry, fetched_at = cache_get_entry("versions", name)
+    recently_failed = cache_get("versions_miss", name) is not None
+    if entry is not None:
+        if time.time() - fetched_at > CACHE_TTL["versions"] and not recently_failed:
+            revalidate_in_background(name)
+        return entry["version"]
+    if recently_failed:
+        return None
+    return revalidate(name)
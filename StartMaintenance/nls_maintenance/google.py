@@ -3,15 +3,23 @@ from dotenv import load_dotenv
 from datetime import datetime, timedelta
 import json
 import difflib
-from GoogleTest.googleConnect import google_connect, make_nls_request, NLS_SPREADSHEET_ID, TEMPLATE_SHEET_NAME
+from GoogleTest.googleConnect import (
+    google_connect,
+    get_sheet_properties,
+    find_sheet_properties,
+    invalidate_sheet_properties,
+    grid_expansion_requests,
+    text_rule_requests,
+    make_nls_request,
+    NLS_SPREADSHEET_ID,
+    TEMPLATE_SHEET_NAME,
+)
 
 load_dotenv()
 
 # Constants
 NLS_GOOGLE_STATUS = os.getenv("NLS_GOOGLE_STATUS_FILTER")
 
-service = google_connect()
-
 #
 #
 #
@@ -63,15 +71,9 @@ def return_list_all_sites(values: list[list[str]]) -> str:
 
 
 def get_sheet_id_by_name(sheet_name):
-    # Fetch the list of sheets in the spreadsheet
-    sheet_metadata = service.spreadsheets().get(spreadsheetId=NLS_SPREADSHEET_ID).execute()
-    sheets = sheet_metadata.get("sheets", "")
-
-    # Search for the sheet ID based on the provided name
-    for sheet in sheets:
-        if sheet["properties"]["title"] == sheet_name:
-            return sheet["properties"]["sheetId"]
-    return None
+    # Tab titles come from the cached spreadsheet metadata, the API is only called again when a title is missing
+    properties = find_sheet_properties(NLS_SPREADSHEET_ID, sheet_name)
+    return properties["sheetId"] if properties else None
 
 
 def get_previous_month_title() -> str:
@@ -86,6 +88,7 @@ def get_previous_month_title() -> str:
 
 
 def clone_sheet(title, source_sheet_name):
+    service = google_connect()
     source_sheet_id = get_sheet_id_by_name(source_sheet_name)
     if source_sheet_id is None:
         print(f"No sheet found with the name {source_sheet_name}")
@@ -104,6 +107,7 @@ def clone_sheet(title, source_sheet_name):
     }
     try:
         response = service.spreadsheets().batchUpdate(spreadsheetId=NLS_SPREADSHEET_ID, body=body).execute()
+        invalidate_sheet_properties(NLS_SPREADSHEET_ID)  # The new tab is not in the cached metadata yet
         new_sheet_id = response["replies"][0]["duplicateSheet"]["properties"]["sheetId"]
         print(f"Cloned sheet with title: {title}, Sheet ID: {new_sheet_id}")
         return new_sheet_id
@@ -117,6 +121,7 @@ def insert_and_fill_row(sheet_id, row_index, new_row_values):
     Inserts a blank row at `row_index` (zero–based) in the sheet with ID sheet_id,
     then writes new_row_values into columns A–D of that row.
     """
+    service = google_connect()
     requests = [
         # 1) insert a blank row
         {
@@ -148,110 +153,102 @@ def create_nls_sheet(columns_to_clone: list[str]) -> int | None:
     """
     Ensure that a sheet for the current month exists. If it does not:
       1. Duplicate your TEMPLATE_SHEET_NAME → current_month_title.
-      2. If a previous-month sheet exists, fetch its data and copy ONLY the columns
+      2. If a previous-month sheet exists, copy its header and ONLY the columns
          in `columns_to_clone` into the new sheet (leaving all other columns blank).
 
+    Everything happens server-side in one batchUpdate (duplicateSheet + copyPaste), so only
+    last month's header row is downloaded, however large the sheet is.
+
     Returns:
       - The sheetId of the existing or newly created sheet on success,
       - None if we failed to create/get it.
     """
+    service = google_connect()
     # 1) Determine this month’s and last month’s titles
     current_title = datetime.now().strftime("%B %Y")
     prev_title = get_previous_month_title()
 
-    # 2) If “current month” already exists, just return its ID:
-    existing = get_sheet_id_by_name(current_title)
-    if existing is not None:
+    # 2) If “current month” already exists, just return its ID. The metadata is read fresh here: the tab may have
+    #    been created by someone else since it was cached, and the new sheetId below must not collide.
+    sheets = get_sheet_properties(NLS_SPREADSHEET_ID, refresh=True)
+    if current_title in sheets:
+        existing = sheets[current_title]["sheetId"]
         print(f"🔍 Sheet '{current_title}' already exists (ID={existing}).")
         return existing
 
-    # 3) Duplicate the TEMPLATE sheet → new sheet called “current_title”
-    print(f"✂️  Creating new sheet by cloning template: '{TEMPLATE_SHEET_NAME}' → '{current_title}'")
-    new_sheet_id = clone_sheet(current_title, TEMPLATE_SHEET_NAME)
-    if new_sheet_id is None:
-        print("❌ Could not duplicate the template sheet. Aborting.")
-        return None
-
-    # 4) If last month’s sheet exists, pull its values and copy only desired columns:
-    prev_id = get_sheet_id_by_name(prev_title)
-    if prev_id is None:
+    # 3) If there is no previous month, a plain copy of the template is all we need
+    prev = sheets.get(prev_title)
+    if prev is None:
+        print(f"✂️  Creating new sheet by cloning template: '{TEMPLATE_SHEET_NAME}' → '{current_title}'")
+        new_sheet_id = clone_sheet(current_title, TEMPLATE_SHEET_NAME)
+        if new_sheet_id is None:
+            print("❌ Could not duplicate the template sheet. Aborting.")
+            return None
         print(f"ℹ️ No sheet named '{prev_title}' found. Leaving '{current_title}' with just the template headers.")
         return new_sheet_id
 
-    # 5) Read ALL values from last month’s sheet:
-    #    We assume at most, say, columns A→Z (you can adjust the range if you have more columns).
-    prev_range = f"'{prev_title}'!A1:Z1000"
-    prev_result = service.spreadsheets().values().get(spreadsheetId=NLS_SPREADSHEET_ID, range=prev_range).execute()
-    prev_values = prev_result.get("values", [])
-    if not prev_values:
-        print(f"⚠️ '{prev_title}' is empty. No data to copy.")
-        return new_sheet_id
+    template = sheets.get(TEMPLATE_SHEET_NAME)
+    if template is None:
+        print(f"No sheet found with the name {TEMPLATE_SHEET_NAME}")
+        print("❌ Could not duplicate the template sheet. Aborting.")
+        return None
 
-    # 6) Determine which column-indices in row 1 we want to copy:
-    header_row = prev_values[0]
-    # Build a mapping: header name → its zero‐based index in prev sheet
-    header_to_index = {h: i for i, h in enumerate(header_row)}
+    # 4) Only last month's header row is read, to find which columns to carry over
+    header_result = service.spreadsheets().values().get(spreadsheetId=NLS_SPREADSHEET_ID, range=f"'{prev_title}'!1:1").execute()
+    header_row = (header_result.get("values") or [[]])[0]
+    if not header_row:
+        print(f"⚠️ '{prev_title}' is empty. No data to copy.")
+    header_to_index = {}
+    for i, h in enumerate(header_row):
+        header_to_index.setdefault(h, i)  # First match wins, like header.index()
 
-    # Make a list of zero‐based indices of columns we want to clone. If a column in
-    # columns_to_clone doesn’t appear in header, we’ll skip it (but still leave that column blank).
-    cols_indices: list[int] = []
+    # If a column in columns_to_clone doesn’t appear in the header, we skip it (leaving that column blank).
+    cols_indices = set()
     for col_name in columns_to_clone:
         if col_name in header_to_index:
-            cols_indices.append(header_to_index[col_name])
-        else:
+            cols_indices.add(header_to_index[col_name])
+        elif header_row:
             print(f"⚠️ Column '{col_name}' not found in '{prev_title}' header; skipping it.")
-
-    if not cols_indices:
+    if header_row and not cols_indices:
         print("⚠️ None of the requested columns were found in the previous sheet. Nothing to copy.")
-        return new_sheet_id
 
-    # 7) Build a new “partial” data‐array for ALL rows of last month—but only in the chosen columns.
-    #    We will preserve the full header, but for data‐rows we blank out everything except the chosen columns.
-    max_cols = len(header_row)
-    new_data: list[list[str]] = []
-
-    # Row 1 in the new sheet should be exactly the same header as template (which we assume matches prev header),
-    # so let’s copy header_row into new_data[0]:
-    new_data.append(header_row)
-
-    # For rows 2…N in prev_values, we copy only chosen columns; other columns become "".
-    for old_row in prev_values[1:]:
-        # Pad old_row to the full width so indexing doesn’t break:
-        padded_old = old_row + [""] * (max_cols - len(old_row))
-
-        # Re‐build a new row of length=max_cols:
-        new_row = []
-        for col_idx in range(max_cols):
-            if col_idx in cols_indices:
-                new_row.append(padded_old[col_idx])
-            else:
-                new_row.append("")  # leave blank
-        new_data.append(new_row)
-
-    # 8) Write new_data into the newly created sheet (current_title).
-    #    We need a range cover from A1 to however many rows/columns we have.
-    num_rows = len(new_data)
-    num_cols = max_cols
-
-    # Convert num_cols to column letter. E.g. 1 → A, 2 → B, … 26→Z, 27→AA
-    def _column_letter(n: int) -> str:
-        result = ""
-        while n > 0:
-            n, rem = divmod(n - 1, 26)
-            result = chr(65 + rem) + result
-        return result
-
-    last_col_letter = _column_letter(num_cols)  # e.g. “I” if max_cols==9
-
-    write_range = f"'{current_title}'!A1:{last_col_letter}{num_rows}"
-    body = {"values": new_data}
-
-    service.spreadsheets().values().update(
-        spreadsheetId=NLS_SPREADSHEET_ID,
-        range=write_range,
-        valueInputOption="USER_ENTERED",
-        body=body,
-    ).execute()
+    # 5) One batch: duplicate the template under an id we pick, grow it to last month's size, then paste
+    #    the header and each run of adjacent cloned columns across as plain values.
+    new_sheet_id = max(properties["sheetId"] for properties in sheets.values()) + 1
+    prev_grid = prev.get("gridProperties", {})
+    rows, columns = prev_grid.get("rowCount", 0), prev_grid.get("columnCount", 0)
+
+    def copy_values(start_row, end_row, start_column, end_column):
+        source = {
+            "sheetId": prev["sheetId"],
+            "startRowIndex": start_row,
+            "endRowIndex": end_row,
+            "startColumnIndex": start_column,
+            "endColumnIndex": end_column,
+        }
+        return {"copyPaste": {"source": source, "destination": dict(source, sheetId=new_sheet_id), "pasteType": "PASTE_VALUES"}}
+
+    requests = [{"duplicateSheet": {"sourceSheetId": template["sheetId"], "newSheetId": new_sheet_id, "newSheetName": current_title}}]
+    requests += grid_expansion_requests(new_sheet_id, template.get("gridProperties", {}), rows, columns)
+    if header_row:
+        requests.append(copy_values(0, 1, 0, len(header_row)))
+    runs = []
+    for col_idx in sorted(cols_indices):
+        if runs and runs[-1][1] == col_idx:
+            runs[-1][1] = col_idx + 1
+        else:
+            runs.append([col_idx, col_idx + 1])
+    requests += [copy_values(1, rows, start, end) for start, end in runs if rows > 1]
+
+    print(f"✂️  Creating new sheet by cloning template: '{TEMPLATE_SHEET_NAME}' → '{current_title}'")
+    try:
+        service.spreadsheets().batchUpdate(spreadsheetId=NLS_SPREADSHEET_ID, body={"requests": requests}).execute()
+    except Exception as e:
+        print(f"Failed to clone the sheet: {e}")
+        print("❌ Could not duplicate the template sheet. Aborting.")
+        return None
+    finally:
+        invalidate_sheet_properties(NLS_SPREADSHEET_ID)  # The new tab is not in the cached metadata yet
 
     print(f"✅ Created '{current_title}' (sheetId={new_sheet_id}) and copied columns {columns_to_clone} from '{prev_title}'.")
     return new_sheet_id
@@ -293,6 +290,7 @@ def compute_row_diffs(old_rows, new_rows):
 
 
 def check_for_data_update(sheet_id, range_name, new_data):
+    service = google_connect()
     try:
         result = service.spreadsheets().values().get(spreadsheetId=NLS_SPREADSHEET_ID, range=range_name).execute()
         existing_data = result.get("values", [])
@@ -322,6 +320,7 @@ def hex_to_rgb_norm(hex_color):
 
 
 def color_formatting(sheet_id, status_column_index, sheet_title):
+    service = google_connect()
     # Assuming `NLS_GOOGLE_STATUS` contains a JSON string of statuses
     try:
         status_list = json.loads(NLS_GOOGLE_STATUS)
@@ -346,30 +345,16 @@ def color_formatting(sheet_id, status_column_index, sheet_title):
         status_list[-1]: RED,
     }
 
-    requests = []
-    for status, color in status_colors.items():
-        requests.append(
-            {
-                "addConditionalFormatRule": {
-                    "rule": {
-                        "ranges": [
-                            {
-                                "sheetId": sheet_id,
-                                "startRowIndex": 1,  # Assuming headers are in the first row
-                                "endRowIndex": 1000,  # Adjust as necessary
-                                "startColumnIndex": status_column_index,
-                                "endColumnIndex": status_column_index + 1,
-                            }
-                        ],
-                        "booleanRule": {
-                            "condition": {"type": "TEXT_EQ", "values": [{"userEnteredValue": status}]},
-                            "format": {"backgroundColor": color},
-                        },
-                    },
-                    "index": 0,  # Rule priority order
-                }
-            }
-        )
+    # Only the rules that are missing or out of date are sent, so re-running never piles up duplicates
+    status_range = {
+        "sheetId": sheet_id,
+        "startRowIndex": 1,  # Assuming headers are in the first row; no endRowIndex, so it covers every row the tab grows to
+        "startColumnIndex": status_column_index,
+        "endColumnIndex": status_column_index + 1,
+    }
+    requests = text_rule_requests(NLS_SPREADSHEET_ID, sheet_id, status_range, status_colors)
+    if not requests:
+        return
 
     # Send batchUpdate to apply all formatting rules
     body = {"requests": requests}
@@ -424,7 +409,7 @@ def update_google_sheet(site_name, data, column_name):
         print(f"No sheet found for {title}. Please check the sheet name.")
         return
 
-    range_name = f"{title}!A1:Z1000"
+    range_name = f"'{title}'"  # The whole populated area of the tab
     try:
         result = service.spreadsheets().values().get(spreadsheetId=NLS_SPREADSHEET_ID, range=range_name).execute()
         values = result.get("values", [])
@@ -1,9 +1,15 @@
+from StartMaintenance.maintenance.clickup import list_folders, list_lists, list_sites_maintenance
+
+
 def nls_maintenance():
+    refresh = False
     while True:
         # === FOLDER MENU ===
         print("\n📁 FOLDER MENU:")
+        print("Type 'r' to refresh folders.")
         print("Type 'exit' to return to Main Menu.")
-        folders = list_folders()  # Maintenance Plan | Canceled
+        folders = list_folders(refresh=refresh)  # Maintenance Plan | Canceled
+        refresh = False
         if not folders:
             print("No Folders")
             return
@@ -11,6 +17,9 @@ def nls_maintenance():
         folder_input = input("Choose a folder number: ").strip()
         if folder_input.lower() == "exit":
             break
+        if folder_input.lower() == "r":
+            refresh = True
+            continue
         if not folder_input.isdigit() or int(folder_input) not in range(1, len(folders) + 1):
             print("Invalid folder selection.")
             continue
@@ -22,9 +31,10 @@ def nls_maintenance():
             # === LIST MENU ===
             print("\n📋 LIST MENU:")
             print("Type '.' to go back to Folder Menu.")
-            print("Type 'r' to refresh folders.")
+            print("Type 'r' to refresh lists.")
             print("Type 'exit' to return to Main Menu.")
-            lists = list_lists(folder_id)  # Hosting Name
+            lists = list_lists(folder_id, refresh=refresh)  # Hosting Name
+            refresh = False
             if not lists:
                 print("No Lists")
                 break
@@ -32,7 +42,8 @@ def nls_maintenance():
             list_input = input("Choose a list number: ").strip()
             if list_input == ".":
                 break
-            if folder_input == "refresh":
+            if list_input.lower() == "r":
+                refresh = True
                 continue
             if list_input.lower() == "exit":
                 return
@@ -47,9 +58,10 @@ def nls_maintenance():
                 # === SITE MENU ===
                 print("\n🌐 SITE MENU:")
                 print("Type '.' to go back to List Menu.")
-                print("Type 'r' to refresh List Menu.")
+                print("Type 'r' to refresh sites.")
                 print("Type 'exit' to return to Main Menu.")
-                sites = list_sites_maintenance(list_id)  # List sites
+                sites = list_sites_maintenance(list_id, refresh=refresh)  # List sites
+                refresh = False
                 if not sites:
                     print("No Sites")
                     print(sites)
@@ -58,7 +70,8 @@ def nls_maintenance():
                 site_input = input("Choose a site number: ").strip()
                 if site_input == ".":
                     break
-                if folder_input == "refresh":
+                if site_input.lower() == "r":
+                    refresh = True
                     continue
                 if site_input.lower() == "exit":
                     return
@@ -83,7 +96,7 @@ def nls_maintenance():
                 #     print("0. Change Clickup Status")
                 #     print("==================================")
                 #     print("Type '.' to go back to Site Menu.")
-                #     print("Type 'r' to refresh Site Menu.")
+                #     print("Type 'r' to refresh this site.")
                 #     print("Type 'exit' to return to Main Menu.")
                 #     print("==================================")
 
@@ -0,0 +1,88 @@
+"""
+Compares the key-based row diff used by create_or_update_sheet with the difflib.SequenceMatcher
+version it replaced, on month tabs of 1k, 10k and 50k rows.
+
+Run from the repository root:
+    python -m benchmarks.row_diff_benchmark
+"""
+
+import difflib
+import random
+import time
+
+from StartMaintenance.maintenance.row_diff import diff_rows, apply_row_diff
+
+SIZES = (1_000, 10_000, 50_000)
+STATUSES = ["to do", "in progress", "review", "complete"]
+
+
+def legacy_compute_row_diffs(old_rows, new_rows):
+    """compute_row_diffs as it was before row_diff.py (difflib over whole row tuples)."""
+    hashable_old = [tuple(r) for r in old_rows]
+    hashable_new = [tuple(r) for r in new_rows]
+    sm = difflib.SequenceMatcher(None, hashable_old, hashable_new)
+    diffs = []
+    for tag, i1, i2, j1, j2 in sm.get_opcodes():
+        if tag == "insert":
+            diffs.append(("insert", i1, new_rows[j1:j2]))
+        elif tag == "delete":
+            diffs.append(("delete", old_rows[i1:i2], i1))
+        elif tag == "replace":
+            length = max(i2 - i1, j2 - j1)
+            for k in range(length):
+                old = old_rows[i1 + k] if i1 + k < i2 else None
+                new = new_rows[j1 + k] if j1 + k < j2 else None
+                diffs.append(("replace", i1 + k, old, new))
+    return diffs
+
+
+def month_tab(size, rng):
+    """Rows shaped like google_list_formatter() output: folder and list header rows, then sorted tasks."""
+    rows = [["Folder", "List", "Task Name", "Status"]]
+    folders = max(1, size // 500)
+    for f in range(folders):
+        folder = f"Folder {f}"
+        rows.append([folder, "", "", ""])
+        for l in range(5):
+            name = f"List {l}"
+            rows.append([folder, name, "", ""])
+            tasks = sorted(f"site-{rng.randrange(10**9)}.com" for _ in range(size // (folders * 5)))
+            rows.extend([folder, name, task, rng.choice(STATUSES)] for task in tasks)
+    return rows
+
+
+def next_month(rows, rng):
+    """A month later: ~1% of sites gone, ~1% new, ~5% with a new status."""
+    new = [row[:] for row in rows[:1]]
+    for row in rows[1:]:
+        if row[2] and rng.random() < 0.01:
+            continue
+        row = row[:]
+        if row[2] and rng.random() < 0.05:
+            row[3] = rng.choice(STATUSES)
+        new.append(row)
+        if row[2] and rng.random() < 0.01:
+            new.append([row[0], row[1], row[2] + "-new", "to do"])
+    return new
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - started, result
+
+
+def main():
+    rng = random.Random(2024)
+    print(f"{'rows':>8} {'difflib (s)':>12} {'ops':>7} {'row_diff (s)':>13} {'ops':>7} {'speed-up':>9}")
+    for size in SIZES:
+        old = month_tab(size, rng)
+        new = next_month(old, rng)
+        legacy_seconds, legacy_ops = timed(legacy_compute_row_diffs, old, new)
+        seconds, ops = timed(diff_rows, old, new)
+        assert apply_row_diff(old, ops) == new
+        print(f"{len(old):>8} {legacy_seconds:>12.3f} {len(legacy_ops):>7} {seconds:>13.3f} {len(ops):>7} {legacy_seconds / seconds:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,25 @@
+import time
+
+STARTED = time.perf_counter()  # Taken before any other import so the startup report covers them
+
 import os
+import atexit
 import logging
 import json
 from dotenv import load_dotenv
 
 from ClickupTest.clickupConnect import test_clickup_connection
 from GoogleTest.googleConnect import test_google_sheet_connection, make_nls_request, SHEET_NAME
-from StartMaintenance.maintenance.google import create_or_update_sheet, google_list_formatter
-from StartMaintenance.maintenance.clickup import fetch_shared_folders, fetch_all_tasks_by_folder, return_fetch_all_tasks_by_folder
+from StartMaintenance.maintenance.google import create_or_update_sheet, google_list_formatter, flush_sheet_writes
+from StartMaintenance.maintenance.clickup import (
+    fetch_shared_folders,
+    fetch_all_tasks_by_folder,
+    return_fetch_all_tasks_by_folder,
+    return_fetch_all_tasks_by_team,
+    return_sync_tasks_by_team,
+    sync_all_sites_to_google,
+    refresh_all_domain_expiries,
+)
 from StartMaintenance.maintenance.maintenance import maintenance
 from StartMaintenance.nls_maintenance.nls_maintenance import nls_maintenance
 from StartMaintenance.nls_maintenance.google import create_nls_sheet, return_list_all_sites
@@ -18,6 +31,8 @@ TOMO360_MONTHLY = os.getenv("CLICKUP_T3_MONTHLY_ID")
 SPACE_ID = os.getenv("CLICKUP_NLS_SPACE_ID")
 TEAM = os.getenv("CLICKUP_TEAM_ID")
 USER = os.getenv("CLICKUP_USER_ID")
+# "list": one request per list, "team": team-level task search, "incremental": only tasks updated since the last run
+FETCH_MODE = os.getenv("CLICKUP_FETCH_MODE", "list")
 
 COLUMNS = json.loads(os.getenv("COLUMNS_CLONE", "[]"))
 
@@ -29,6 +44,8 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 
 def main_menu():
     logging.info("NLS Maintenance Terminal Started.")
+    # Google Sheets, ClickUp, WHOIS and the file picker all initialize on first use, so this should stay low
+    logging.info("Startup: menu ready in %.0f ms.", (time.perf_counter() - STARTED) * 1000)
     while True:
         # Menu 1
         print("\nMain Menu:")
@@ -39,6 +56,7 @@ def main_menu():
         user_input = input("Enter your choice: ").strip()
         if user_input.lower() == "exit":
             logging.info("Stopping the program.")
+            flush_sheet_writes()
             break
 
         # Menu 1.1 Test Clickup
@@ -66,17 +84,28 @@ def main_menu():
                 print("1: Create/Update Google Sheet")
                 print("2: List Sites that are assigned")
                 print("3: Execute Maintenance")
-                print("4: Exit Program")
+                print("4: Sync All Sites to Google Sheet")
+                print("5: Refresh Domain Expiries (WHOIS)")
+                print("6: Exit Program")
                 user_input = input("Choose the type of maintenance to work on: ").strip()
 
                 # Menu 3.1 Create/Update New Spreadsheet
                 if user_input == "1":
                     # Fetch all tasks from ClickUp
-                    raw_data = return_fetch_all_tasks_by_folder(TEAM)
-                    # Format the fetched data for Google Sheets
-                    formatted_data = google_list_formatter(raw_data)
-                    # Create or update the Google Sheet with formatted data
-                    create_or_update_sheet(formatted_data)
+                    changed_rows = None  # Only the incremental sync knows what changed, the other modes always diff
+                    if FETCH_MODE == "incremental":
+                        raw_data, changed_rows = return_sync_tasks_by_team(TEAM)
+                    elif FETCH_MODE == "team":
+                        raw_data = return_fetch_all_tasks_by_team(TEAM)
+                    else:
+                        raw_data = return_fetch_all_tasks_by_folder(TEAM)
+                    if raw_data is None:
+                        print("Google Sheet was not updated because some ClickUp lists could not be fetched.")
+                    else:
+                        # Format the fetched data for Google Sheets
+                        formatted_data = google_list_formatter(raw_data)
+                        # Create or update the Google Sheet with formatted data
+                        create_or_update_sheet(formatted_data, changed_rows)
 
                 # Menu 3.2 List All Sites + Status
                 elif user_input == "2":
@@ -86,8 +115,16 @@ def main_menu():
                 elif user_input == "3":
                     maintenance()
 
-                # Exit
+                # Menu 3.4 Sync every assigned site's ClickUp fields to the month sheet
                 elif user_input == "4":
+                    sync_all_sites_to_google(TEAM)
+
+                # Menu 3.5 Look up every assigned site's domain expiry ahead of the maintenance walk-through
+                elif user_input == "5":
+                    refresh_all_domain_expiries(TEAM)
+
+                # Exit
+                elif user_input == "6":
                     print("Exiting the program.")
                 else:
                     print("Invalid input. Restarting...")
@@ -137,6 +174,7 @@ def main_menu():
 
 
 if __name__ == "__main__":
+    atexit.register(flush_sheet_writes)  # Never drop queued sheet writes, even on Ctrl-C or errors
     try:
         main_menu()
     except Exception as e: